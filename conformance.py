@@ -0,0 +1,198 @@
+"""Differential testing of the Uno engines against UnoGame.
+
+Each engine plays the same seeded game, making the same moves, and after
+every move its state must equal the reference UnoGame's: the hands, the top
+card and its effective colour, the direction of play, the current player,
+the pile sizes and the winner. Moves are chosen by a list of integers, each
+picking one of the legal actions, so any sequence is a valid game; see
+conformance_tests.py for Hypothesis generating them.
+
+Run ``python conformance.py --games 200`` to check random games and report
+the turns per second of every engine.
+"""
+import argparse
+from random import Random
+from time import perf_counter
+from uno import UnoGame, KINDS
+from constants import COLORS
+from simulate import MAX_TURNS, game_rng
+try:
+    import numpy as np
+    from vector_uno import VectorUnoGame
+except ImportError:
+    VectorUnoGame = None
+
+
+def game_state(game):
+    """Return the state of an UnoGame that every engine must agree on."""
+    top = game.current_card
+    return (
+        tuple(
+            tuple(sorted(card.kind for card in player.hand))
+            for player in game.players
+        ),
+        top.kind,
+        top._color_id,
+        game.direction,
+        game.current_player.player_id,
+        len(game.draw_pile),
+        len(game.discard_pile),
+        -1 if game.winner is None else game.winner.player_id,
+    )
+
+
+class UnoGameEngine:
+    """The reference: UnoGame played by card index."""
+    name = 'UnoGame'
+
+    def __init__(self, players, seed) -> None:
+        self.game = UnoGame(players, rng=game_rng(seed, 0))
+
+    def apply(self, action):
+        game = self.game
+        game.play_action(action)
+
+    def state(self):
+        return game_state(self.game)
+
+
+class CloneEngine(UnoGameEngine):
+    """UnoGame replaced by a clone() of itself before every move."""
+    name = 'clone'
+
+    def apply(self, action):
+        self.game = self.game.clone()
+        super().apply(action)
+
+
+class UndoEngine(UnoGameEngine):
+    """UnoGame making every move, undoing it, which must restore the
+    snapshot() taken before it, and making it again."""
+    name = 'undo'
+
+    def __init__(self, players, seed) -> None:
+        self.game = UnoGame(players, rng=game_rng(seed, 0), history=True)
+
+    def apply(self, action):
+        game = self.game
+        state = game.snapshot()
+        rng_state = game.rng.getstate()
+        super().apply(action)
+        game.undo()
+        if game.snapshot() != state:
+            raise AssertionError('undo differs after {}'.format(action))
+        game.rng.setstate(rng_state)
+        super().apply(action)
+
+
+class VectorEngine:
+    """A VectorUnoGame of one game, played through its step() policies."""
+    name = 'VectorUnoGame'
+
+    def __init__(self, players, seed) -> None:
+        self.game = VectorUnoGame(1, players, seed)
+        self._index = np.zeros(1, np.intp)
+
+    def apply(self, action):
+        kind, color = action
+        kinds = np.array([-1 if kind is None else kind], np.intp)
+        colors = np.array(
+            [0 if color is None else COLORS.index(color)], np.intp
+        )
+        self.game.step(lambda game, index, legal: (kinds, colors), self._index)
+
+    def state(self):
+        game = self.game
+        hands = game.hands[0]
+        return (
+            tuple(
+                tuple(np.repeat(np.arange(len(KINDS)), hand).tolist())
+                for hand in hands
+            ),
+            int(game.discard_pile[0, game.discard_size[0] - 1]),
+            int(game.color[0]),
+            int(game.direction[0]),
+            int(game.current[0]),
+            int(game.draw_size[0]),
+            int(game.discard_size[0]),
+            int(game.winner[0]),
+        )
+
+
+ENGINES = [CloneEngine, UndoEngine]
+if VectorUnoGame is not None:
+    ENGINES.append(VectorEngine)
+
+
+def check_game(players, seed, choices, engines=ENGINES, max_turns=MAX_TURNS,
+               seconds=None):
+    """Play the game of players players seeded with seed through
+    UnoGameEngine and every one of engines, each move being the legal
+    action numbered choice, modulo their number, in UnoGame.legal_actions()
+    for the next of choices, then the first legal action once they run
+    out, until the game ends or max_turns moves have been made. Raise
+    AssertionError, even under python -O, at the first move after which an
+    engine disagrees with UnoGame. Return the number of moves made, adding
+    the time each engine spent to seconds[engine.name] if given."""
+    reference = UnoGameEngine(players, seed)
+    others = [engine(players, seed) for engine in engines]
+    expected = reference.state()
+    for engine in others:
+        if engine.state() != expected:
+            raise AssertionError(
+                '{} differs after dealing'.format(engine.name)
+            )
+    turns = 0
+    while reference.game.is_active and turns < max_turns:
+        actions = reference.game.legal_actions()
+        choice = choices[turns] if turns < len(choices) else 0
+        action = actions[choice % len(actions)]
+        started = perf_counter()
+        reference.apply(action)
+        if seconds is not None:
+            seconds[reference.name] += perf_counter() - started
+        turns += 1
+        expected = reference.state()
+        for engine in others:
+            started = perf_counter()
+            engine.apply(action)
+            if seconds is not None:
+                seconds[engine.name] += perf_counter() - started
+            if engine.state() != expected:
+                raise AssertionError(
+                    '{} differs from UnoGame after move {}, {}'.format(
+                        engine.name, turns, action
+                    )
+                )
+    return turns
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--players', type=int, default=None,
+        help='players per game, random from 2 to 15 if unset'
+    )
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(args)
+    rng = Random(args.seed)
+    seconds = {engine.name: 0.0 for engine in [UnoGameEngine] + ENGINES}
+    turns = 0
+    for i in range(args.games):
+        players = args.players or rng.randint(2, 15)
+        choices = [rng.randrange(1 << 16) for turn in range(MAX_TURNS)]
+        turns += check_game(
+            players, rng.getrandbits(32), choices, seconds=seconds
+        )
+    print('{} games, {} moves: every engine agrees with UnoGame'.format(
+        args.games, turns
+    ))
+    for name, engine_seconds in seconds.items():
+        print('{:<16} {:>12.1f} moves/sec'.format(
+            name, turns / engine_seconds if engine_seconds else 0.0
+        ))
+
+
+if __name__ == '__main__':
+    main()
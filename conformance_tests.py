@@ -0,0 +1,34 @@
+import pytest
+pytest.importorskip('hypothesis')
+from hypothesis import given, settings, strategies as st
+from uno import PICK_UP_ACTION
+from conformance import *
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    players=st.integers(2, 15),
+    seed=st.integers(0, 2 ** 32 - 1),
+    choices=st.lists(st.integers(0, 1 << 16), max_size=400),
+)
+def engines_agree(players, seed, choices):
+    check_game(players, seed, choices)
+
+
+engines_agree()
+
+
+# a broken engine is caught at the move it goes wrong
+class SkipsPickUps(UnoGameEngine):
+    name = 'broken'
+
+    def apply(self, action):
+        if action == PICK_UP_ACTION:
+            self.game.turn_order.advance()
+        else:
+            super().apply(action)
+
+
+with pytest.raises(AssertionError, match='broken differs'):
+    for seed in range(10):
+        check_game(3, seed, [], engines=[SkipsPickUps])
@@ -0,0 +1,227 @@
+"""Compact binary logs of UnoGames and replaying them.
+
+A log is the bytes MAGIC followed by one record per game:
+
+    players, flags        two bytes: the UnoGame arguments, flags being
+                          RANDOM and COLOR_FIRST_CARD
+    SHUFFLE, n, kinds...  the order of the n cards after every shuffle,
+                          the first being the whole deck
+    index                 the colour, as an index into COLORS, given to a
+                          black first card by color_first_card
+    card [, color]        a card index played from the current player's
+                          hand, with its new colour id for black cards
+    PICK_UP               the current player picked up
+    END, winner           the end of the game and the winner's index, or
+                          NO_WINNER if it was stopped unfinished
+
+Every byte but the markers is below END, so games can be found by
+searching for END alone. Moves are a byte or two each; the deck takes 110.
+
+Pass a GameLogWriter to UnoGame(log=...) to record a game, read logs back
+with GameLogReader and rebuild any position with replay(). Replays play the
+recorded moves and shuffles, without policies or random numbers.
+"""
+from collections import namedtuple
+from mmap import mmap, ACCESS_READ
+from uno import UnoGame, CARDS, BLACK
+from constants import COLORS
+
+
+MAGIC = b'UNO\x01'
+END = 0xFD
+SHUFFLE = 0xFE
+PICK_UP = 0xFF
+NO_WINNER = 0xFF
+# the flags of a game's header
+RANDOM = 1
+COLOR_FIRST_CARD = 2
+
+
+GameRecord = namedtuple('GameRecord', [
+    'players', 'random', 'winner', 'moves', 'color_first_card',
+])
+
+
+class GameLogWriter:
+    """Stream games to file, a path or a binary file opened for writing.
+    Each game is buffered in memory and written when it ends, when the next
+    game starts or when the writer is closed."""
+    def __init__(self, file) -> None:
+        if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+            self._file = open(file, 'wb')
+            self._owned = True
+        else:
+            self._file = file
+            self._owned = False
+        self._file.write(MAGIC)
+        self._game = None
+        self.games = 0
+
+    def __repr__(self) -> str:
+        return '<GameLogWriter object: {} games>'.format(self.games)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self, players, random, color_first_card=False):
+        if self._game is not None:
+            self.end(None)
+        flags = (RANDOM if random else 0) | (
+            COLOR_FIRST_CARD if color_first_card else 0
+        )
+        self._game = bytearray((players, flags))
+
+    def shuffle(self, cards):
+        game = self._game
+        game.append(SHUFFLE)
+        game.append(len(cards))
+        game.extend(card.kind for card in cards)
+
+    def choice(self, index):
+        self._game.append(index)
+
+    def play(self, card, color_id=None):
+        game = self._game
+        if card is None:
+            game.append(PICK_UP)
+        else:
+            game.append(card)
+            if color_id is not None:
+                game.append(color_id)
+
+    def end(self, winner):
+        game = self._game
+        game.append(END)
+        game.append(NO_WINNER if winner is None else winner)
+        self._file.write(game)
+        self._game = None
+        self.games += 1
+
+    def close(self):
+        if self._game is not None:
+            self.end(None)
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class GameLogReader:
+    """Random access to the games in the log at path, which is memory
+    mapped rather than read in. reader[i] is the GameRecord of game i."""
+    def __init__(self, path) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError('Invalid log: empty file')
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError('Invalid log: bad header')
+        # games[i] is the (start, end) of game i, end being its END marker
+        self._games = []
+        start = len(MAGIC)
+        end = self._map.find(bytes((END,)), start)
+        while end >= 0:
+            self._games.append((start, end))
+            start = end + 2
+            end = self._map.find(bytes((END,)), start)
+
+    def __repr__(self) -> str:
+        return '<GameLogReader object: {} games>'.format(len(self))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._games)
+
+    def __getitem__(self, index):
+        start, end = self._games[index]
+        data = self._map
+        flags = data[start + 1]
+        return GameRecord(
+            data[start],
+            bool(flags & RANDOM),
+            None if data[end + 1] == NO_WINNER else data[end + 1],
+            data[start + 2:end],
+            bool(flags & COLOR_FIRST_CARD),
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class _Moves:
+    """A cursor over a GameRecord's moves that also stands in for the
+    game's random number generator, replacing every shuffle with the
+    recorded order and every choice with the recorded one."""
+    __slots__ = ('moves', 'position')
+
+    def __init__(self, moves) -> None:
+        self.moves = moves
+        self.position = 0
+
+    def next(self):
+        byte = self.moves[self.position]
+        self.position += 1
+        return byte
+
+    def shuffle(self, cards):
+        if self.next() != SHUFFLE:
+            raise ValueError('Invalid log: expected a shuffle')
+        n = self.next()
+        start = self.position
+        cards[:] = [CARDS[kind] for kind in self.moves[start:start + n]]
+        self.position += n
+
+    def choice(self, seq):
+        return seq[self.next()]
+
+    @property
+    def done(self):
+        return self.position >= len(self.moves)
+
+
+def iter_replay(record):
+    """Replay the game in record, yielding the UnoGame once dealt and again
+    after each turn. The same game object is yielded each time, so take a
+    snapshot() to keep a position."""
+    moves = _Moves(record.moves)
+    game = UnoGame(
+        record.players, record.random, rng=moves,
+        color_first_card=record.color_first_card
+    )
+    yield game
+    while not moves.done:
+        player = game.current_player
+        card = moves.next()
+        if card == PICK_UP:
+            game.play(player.player_id, None)
+        elif player.hand[card].color_id == BLACK:
+            game.play(player.player_id, card, COLORS[moves.next()])
+        else:
+            game.play(player.player_id, card)
+        yield game
+
+
+def replay(record, turns=None):
+    """Return the UnoGame in record as it was after turns turns, or at the
+    end of the log."""
+    for turn, game in enumerate(iter_replay(record)):
+        if turn == turns:
+            break
+    return game
@@ -0,0 +1,107 @@
+import io
+import os
+import tempfile
+import pytest
+from uno import UnoGame
+from constants import COLORS
+from policies import first_playable, random_playable
+from simulate import simulate, game_rng, play_game
+from gamelog import *
+
+
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, 'games.unolog')
+
+states = []
+positions = []
+with GameLogWriter(path) as log:
+    for i in range(30):
+        rng = game_rng(2, i)
+        game = UnoGame(2 + i % 6, random=i != 7, rng=rng, log=log)
+        if i == 0:
+            positions.append(game.snapshot())
+            for turn in range(20):
+                game.play_turn(random_playable)
+                positions.append(game.snapshot())
+        # game 3 is left unfinished
+        play_game(game, [random_playable] * len(game.players), rng,
+                  10 if i == 3 else 10000)
+        states.append(game.snapshot())
+    # the unfinished game is closed when the next one starts
+    assert log.games == 30
+
+with GameLogReader(path) as reader:
+    assert len(reader) == 30
+    for i, (record, state) in enumerate(zip(reader, states)):
+        assert record.players == 2 + i % 6
+        assert record.random == (i != 7)
+        assert record.winner == state.winner
+        game = replay(record)
+        assert game.snapshot() == state
+    assert reader[3].winner is None
+    assert reader[-1] == reader[29]
+    # every position along the way
+    for position, game in zip(positions, iter_replay(reader[0])):
+        assert game.snapshot() == position
+    assert replay(reader[0], 5).snapshot() == positions[5]
+    assert replay(reader[0], 0).snapshot() == positions[0]
+
+# a whole deck, then a byte for each move
+buffer = io.BytesIO()
+writer = GameLogWriter(buffer)
+game = UnoGame(3, rng=1, log=writer)
+game.play(0, None)
+writer.close()
+data = buffer.getvalue()
+assert data[:len(MAGIC)] == MAGIC
+assert data[len(MAGIC):len(MAGIC) + 4] == bytes((3, 1, SHUFFLE, 108))
+assert data[-3:] == bytes((PICK_UP, END, NO_WINNER))
+assert len(data) == len(MAGIC) + 2 + 110 + 1 + 2
+
+# clones are not logged
+buffer = io.BytesIO()
+writer = GameLogWriter(buffer)
+game = UnoGame(3, rng=1, log=writer)
+game.clone().play(0, None)
+writer.close()
+assert len(buffer.getvalue()) == len(MAGIC) + 2 + 110 + 2
+
+# simulate() logs every game
+simulate_path = os.path.join(directory, 'simulate.unolog')
+with GameLogWriter(simulate_path) as log:
+    stats = simulate(4, 50, first_playable, seed=3, log=log)
+with GameLogReader(simulate_path) as reader:
+    assert len(reader) == 50
+    wins = [0] * 4
+    for record in reader:
+        wins[replay(record).winner.player_id] += 1
+assert wins == stats.wins
+
+# the colour given to a black first card is logged with the deal
+buffer = io.BytesIO()
+writer = GameLogWriter(buffer)
+states = []
+for seed in (8, 1):
+    game = UnoGame(3, rng=seed, log=writer, color_first_card=True)
+    play_game(game, [first_playable] * 3, game.rng, 10000)
+    states.append(game.snapshot())
+writer.close()
+colored_path = os.path.join(directory, 'colored.unolog')
+with open(colored_path, 'wb') as f:
+    f.write(buffer.getvalue())
+with GameLogReader(colored_path) as reader:
+    first, second = reader
+    assert first.color_first_card and second.color_first_card
+    # 8 deals a black first card, its colour logged after the deck, and 1
+    # does not
+    assert first.moves[110] in range(len(COLORS))
+    first_card = next(iter_replay(first)).current_card
+    assert first_card.temp_color is not None
+    assert replay(first).snapshot() == states[0]
+    assert replay(second).snapshot() == states[1]
+
+bad_path = os.path.join(directory, 'bad.unolog')
+with open(bad_path, 'wb') as f:
+    f.write(b'not a log')
+with pytest.raises(ValueError):
+    GameLogReader(bad_path)
@@ -0,0 +1,142 @@
+"""Instrumentation for UnoGame: event hooks and a per-phase timer.
+
+Pass a GameHooks to UnoGame(hooks=...) to be told of each event in the
+game. Every method does nothing unless overridden:
+
+    game_start(game)                   once the cards are dealt
+    turn_start(game, player)           by play_turn, before the policy
+    card_played(game, player, card)    once card is on the discard pile
+    pick_up(game, player, n)           before player picks up n cards
+    cards_drawn(game, player, cards)   after they have been picked up
+    reshuffle(game)                    after the discard pile is reused
+    turn_end(game, player)             at the end of play()
+    game_end(game, winner)             after the winning turn_end
+    game_stopped(game)                 by simulate.play_game, if it stops
+                                       the game before anyone wins
+
+Games without hooks only pay for an ``is not None`` test at each event.
+
+Run ``python simulate.py --phases`` for PhaseTimer's breakdown of where a
+simulation spends its time, or ``--profile`` for cProfile's.
+"""
+from time import perf_counter
+
+
+class GameHooks:
+    def game_start(self, game):
+        pass
+
+    def turn_start(self, game, player):
+        pass
+
+    def card_played(self, game, player, card):
+        pass
+
+    def pick_up(self, game, player, n):
+        pass
+
+    def cards_drawn(self, game, player, cards):
+        pass
+
+    def reshuffle(self, game):
+        pass
+
+    def turn_end(self, game, player):
+        pass
+
+    def game_end(self, game, winner):
+        pass
+
+    def game_stopped(self, game):
+        pass
+
+
+# the phase each event starts; time runs in it until the next event
+PHASES = {
+    'choose': 'legal moves and policy',
+    'play': 'playing the card',
+    'draw': 'picking up and reshuffling',
+    'between': 'between turns',
+}
+COUNTERS = (
+    'games', 'turns', 'cards_played', 'pick_ups', 'cards_drawn',
+    'reshuffles', 'wins',
+)
+
+
+class PhaseTimer(GameHooks):
+    """Count events and add up the time spent in each of PHASES across
+    every game it instruments. The time between a turn_end and the next
+    turn_start, spent by the caller and in is_active, counts as between
+    turns. Nothing is timed between the end of one game, won or stopped,
+    and the start of the next."""
+    def __init__(self, clock=perf_counter) -> None:
+        self.clock = clock
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self._phase = None
+        self._since = 0.0
+
+    def __repr__(self) -> str:
+        return '<PhaseTimer object: {} turns>'.format(self.counts['turns'])
+
+    def _enter(self, phase):
+        now = self.clock()
+        if self._phase is not None:
+            self.seconds[self._phase] += now - self._since
+        self._phase = phase
+        self._since = now
+
+    @property
+    def total_seconds(self):
+        return sum(self.seconds.values())
+
+    def game_start(self, game):
+        self.counts['games'] += 1
+        self._enter('between')
+
+    def turn_start(self, game, player):
+        self._enter('choose')
+
+    def card_played(self, game, player, card):
+        self.counts['cards_played'] += 1
+        self._enter('play')
+
+    def pick_up(self, game, player, n):
+        self.counts['pick_ups'] += 1
+        self._enter('draw')
+
+    def cards_drawn(self, game, player, cards):
+        self.counts['cards_drawn'] += len(cards)
+        self._enter('play')
+
+    def reshuffle(self, game):
+        self.counts['reshuffles'] += 1
+
+    def turn_end(self, game, player):
+        self.counts['turns'] += 1
+        self._enter('between')
+
+    def game_end(self, game, winner):
+        self.counts['wins'] += 1
+        self._enter(None)
+
+    def game_stopped(self, game):
+        self._enter(None)
+
+
+def print_phases(timer):
+    total = timer.total_seconds
+    turns = max(timer.counts['turns'], 1)
+    print('{:<28} {:>9} {:>7} {:>10}'.format(
+        'Phase', 'seconds', 'share', 'us/turn'
+    ))
+    for phase, description in PHASES.items():
+        seconds = timer.seconds[phase]
+        print('{:<28} {:>9.3f} {:>6.1f}% {:>10.2f}'.format(
+            description, seconds, 100 * seconds / total if total else 0.0,
+            1e6 * seconds / turns
+        ))
+    print(', '.join(
+        '{}: {}'.format(name, count) for name, count in timer.counts.items()
+    ))
@@ -0,0 +1,86 @@
+import contextlib
+import io
+from uno import UnoGame, UnoCard
+from policies import first_playable
+from simulate import simulate, main as simulate_main
+from instrument import *
+
+
+class Recorder(GameHooks):
+    def __init__(self):
+        self.events = []
+
+    def turn_start(self, game, player):
+        self.events.append(('turn_start', player.player_id))
+
+    def card_played(self, game, player, card):
+        self.events.append(('card_played', card.kind))
+
+    def pick_up(self, game, player, n):
+        self.events.append(('pick_up', player.player_id, n))
+
+    def cards_drawn(self, game, player, cards):
+        self.events.append(('cards_drawn', player.player_id, len(cards)))
+
+    def turn_end(self, game, player):
+        self.events.append(('turn_end', player.player_id))
+
+    def game_end(self, game, winner):
+        self.events.append(('game_end', winner.player_id))
+
+    def game_stopped(self, game):
+        self.events.append(('game_stopped',))
+
+
+recorder = Recorder()
+game = UnoGame(3, random=False, hooks=recorder)
+game.play(0, None)
+game.play_turn(first_playable)
+game.play(2, 5)
+assert recorder.events == [
+    ('pick_up', 0, 1), ('cards_drawn', 0, 1), ('turn_end', 0),
+    ('turn_start', 1), ('card_played', UnoCard('red', 7).kind),
+    ('turn_end', 1), ('card_played', UnoCard('red', 'skip').kind),
+    ('turn_end', 2),
+]
+# clones are not instrumented
+game.clone().play_turn(first_playable)
+assert len(recorder.events) == 8
+
+recorder = Recorder()
+game = UnoGame(2, rng=1, hooks=recorder)
+while game.is_active:
+    game.play_turn(first_playable)
+assert recorder.events[-2:] == [
+    ('turn_end', game.winner.player_id), ('game_end', game.winner.player_id)
+]
+
+timer = PhaseTimer()
+stats = simulate(4, 50, first_playable, seed=2, max_turns=200, hooks=timer)
+assert timer.counts['games'] == 50
+assert timer.counts['turns'] == stats.turns
+assert timer.counts['wins'] == 50 - stats.unfinished
+assert timer.counts['cards_drawn'] == stats.cards_drawn
+assert timer.counts['cards_played'] + timer.counts['pick_ups'] >= stats.turns
+assert all(seconds > 0 for seconds in timer.seconds.values())
+assert timer.total_seconds <= stats.seconds
+
+# a game stopped at max_turns stops the clock, as a won game does
+recorder = Recorder()
+simulate(2, 1, first_playable, seed=1, max_turns=3, hooks=recorder)
+assert recorder.events[-2:] == [('turn_end', 0), ('game_stopped',)]
+now = [0.0]
+timer = PhaseTimer(clock=lambda: now[0])
+simulate(2, 1, first_playable, seed=1, max_turns=3, hooks=timer)
+now[0] = 100.0
+UnoGame(2, rng=1, hooks=timer)
+assert timer.total_seconds == 0
+
+output = io.StringIO()
+with contextlib.redirect_stdout(output):
+    simulate_main(
+        ['--games', '20', '--seed', '1', '--phases', '--profile', '5']
+    )
+output = output.getvalue()
+assert 'legal moves and policy' in output
+assert 'cumulative' in output
@@ -0,0 +1,192 @@
+"""Information set Monte Carlo tree search (ISMCTS) for Uno.
+
+ISMCTSPolicy is a policy for UnoGame.play_turn. For every decision it
+searches a single tree over many determinizations: games built from the
+player's Observation with the cards they cannot see (the other hands and
+the draw pile) dealt at random, consistent with the hand sizes.
+
+Run ``python mcts.py --games 100`` to pit it against first_playable bots.
+"""
+import argparse
+from math import log, sqrt
+from time import perf_counter
+from uno import UnoGame, CARDS, DECK
+from policies import first_playable
+from simulate import MAX_TURNS, simulate, print_stats
+
+
+DECK_COUNTS = [0] * len(CARDS)
+for card in DECK:
+    DECK_COUNTS[card.kind] += 1
+
+
+def determinize(observation, rng):
+    """Return a game matching observation, with the cards the observing
+    player cannot see dealt at random into the other hands and the draw
+    pile."""
+    counts = DECK_COUNTS[:]
+    for card in observation.hand + observation.discard_pile:
+        counts[card.kind] -= 1
+    unseen = [CARDS[kind] for kind, n in enumerate(counts) for i in range(n)]
+    rng.shuffle(unseen)
+    game = UnoGame(len(observation.hand_sizes), rng=rng)
+    game.discard_pile[:] = observation.discard_pile
+    for player, size in zip(game.players, observation.hand_sizes):
+        if player.player_id == observation.player_id:
+            player.replace_hand(observation.hand)
+        else:
+            player.replace_hand(unseen[-size:])
+            del unseen[-size:]
+    game.draw_pile[:] = unseen
+    game.turn_order.position = observation.player_id
+    game.turn_order.direction = observation.direction
+    return game
+
+
+def redeal(game, player_id, rng):
+    """Shuffle the draw pile and every hand but player_id's together and
+    deal them out again, keeping their sizes."""
+    others = [player for player in game.players if player.player_id != (
+        player_id
+    )]
+    unseen = game.draw_pile[:]
+    for player in others:
+        unseen.extend(player.hand)
+    rng.shuffle(unseen)
+    for player in others:
+        size = len(player.hand)
+        player.replace_hand(unseen[-size:])
+        del unseen[-size:]
+    game.draw_pile[:] = unseen
+
+
+class _Node:
+    __slots__ = ('parent', 'action', 'player', 'children', 'visits', 'wins',
+                 'available')
+
+    def __init__(self, parent=None, action=None, player=None) -> None:
+        self.parent = parent
+        self.action = action
+        self.player = player
+        self.children = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.available = 0
+
+    def select(self, actions, exploration):
+        """Return the child for one of actions with the best upper
+        confidence bound, counting every one of them as available."""
+        best = best_score = None
+        for action in actions:
+            child = self.children[action]
+            child.available += 1
+            score = child.wins / child.visits + exploration * sqrt(
+                log(child.available) / child.visits
+            )
+            if best_score is None or score > best_score:
+                best, best_score = child, score
+        return best
+
+
+class ISMCTSPolicy:
+    """Search for each move until iterations playouts have been run or
+    time_limit seconds have passed, whichever comes first. Playouts use
+    rollout_policy and stop after max_rollout turns, counting as a share of
+    a win for every player."""
+    def __init__(self, iterations=1000, time_limit=None,
+                 rollout_policy=first_playable, exploration=0.7,
+                 max_rollout=MAX_TURNS) -> None:
+        if iterations is None and time_limit is None:
+            raise ValueError('Invalid budget: need iterations or time_limit')
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.rollout_policy = rollout_policy
+        self.exploration = exploration
+        self.max_rollout = max_rollout
+
+    def __repr__(self) -> str:
+        return '<ISMCTSPolicy object: {} iterations, {} seconds>'.format(
+            self.iterations, self.time_limit
+        )
+
+    def __call__(self, observation, moves, rng):
+        if len(moves) == 1 and not moves[0].needs_color:
+            return moves[0].card, None
+        kind, color = self.search(observation, rng)
+        return observation.hand.index(CARDS[kind]), color
+
+    def search(self, observation, rng):
+        """Return the most visited (kind, color) action for the observing
+        player. At least one iteration is run, however small the budget."""
+        if self.time_limit is None:
+            deadline = None
+        else:
+            deadline = perf_counter() + self.time_limit
+        root = _Node()
+        base = determinize(observation, rng)
+        iteration = 0
+        while True:
+            game = base.clone(rng)
+            redeal(game, observation.player_id, rng)
+            self._iterate(root, game, rng)
+            iteration += 1
+            if self.iterations is not None and iteration >= self.iterations:
+                break
+            if deadline is not None and perf_counter() >= deadline:
+                break
+        return max(root.children.values(), key=lambda c: c.visits).action
+
+    def _iterate(self, node, game, rng):
+        exploration = self.exploration
+        while game.is_active:
+            actions = game.legal_actions()
+            untried = [a for a in actions if a not in node.children]
+            if untried:
+                for action in actions:
+                    if action in node.children:
+                        node.children[action].available += 1
+                action = rng.choice(untried)
+                child = _Node(node, action, game.current_player.player_id)
+                child.available = 1
+                node.children[action] = child
+                game.play_action(action)
+                node = child
+                break
+            node = node.select(actions, exploration)
+            game.play_action(node.action)
+
+        policy = self.rollout_policy
+        turns = 0
+        while game.is_active and turns < self.max_rollout:
+            game.play_turn(policy, rng)
+            turns += 1
+
+        winner = game.winner
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 1 / len(game.players)
+            elif winner.player_id == node.player:
+                node.wins += 1
+            node = node.parent
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument(
+        '--time-limit', type=float, default=None,
+        help='seconds per move, as well as or instead of --iterations'
+    )
+    args = parser.parse_args(args)
+    iterations = args.iterations if args.iterations > 0 else None
+    policy = ISMCTSPolicy(iterations, args.time_limit)
+    policies = [policy] + [first_playable] * (args.players - 1)
+    print_stats(simulate(args.players, args.games, policies, args.seed))
+
+
+if __name__ == '__main__':
+    main()
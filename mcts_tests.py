@@ -0,0 +1,82 @@
+import pytest
+from random import Random
+from time import perf_counter
+from uno import UnoGame, UnoCard
+from policies import first_playable
+from simulate import simulate
+from mcts import *
+
+game = UnoGame(3, rng=4)
+rng = Random(1)
+for i in range(10):
+    game.play_turn(first_playable)
+player = game.current_player
+observation = game.observe()
+clone = determinize(observation, rng)
+seat = player.player_id
+others = [p for p in game.players if p is not player]
+assert clone.current_player.player_id == seat
+assert clone.direction == game.direction
+assert clone.players[seat].hand == player.hand
+assert [len(p.hand) for p in clone.players] == [
+    len(p.hand) for p in game.players
+]
+assert len(clone.draw_pile) == len(game.draw_pile)
+assert clone.discard_pile == game.discard_pile
+assert clone.current_card._color == game.current_card._color
+unseen = sorted(
+    card.kind for card in game.draw_pile + others[0].hand + others[1].hand
+)
+assert sorted(
+    [card.kind for card in clone.draw_pile] +
+    [card.kind for p in clone.players if p.player_id != seat
+     for card in p.hand]
+) == unseen
+other = clone.players[others[0].player_id]
+assert other.kind_counts == [
+    sum(card.kind == kind for card in other.hand)
+    for kind in range(len(other.kind_counts))
+]
+
+redealt = clone.clone(rng)
+redeal(redealt, seat, rng)
+assert redealt.players[seat].hand == player.hand
+assert sorted(
+    [card.kind for card in redealt.draw_pile] +
+    [card.kind for p in redealt.players if p.player_id != seat
+     for card in p.hand]
+) == unseen
+assert [len(p.hand) for p in redealt.players] == [
+    len(p.hand) for p in game.players
+]
+
+policy = ISMCTSPolicy(iterations=30)
+moves = list(game.legal_moves())
+card, new_color = policy(observation, moves, rng)
+assert card in [move.card for move in moves]
+if card is not None:
+    assert (new_color is not None) == (player.hand[card].color == 'black')
+
+policy = ISMCTSPolicy(iterations=None, time_limit=0.05)
+game = UnoGame(4, rng=2)
+game.players[0].add_cards([UnoCard('black', 'wildcard')])
+started = perf_counter()
+card, new_color = policy(game.observe(), list(game.legal_moves()), rng)
+assert perf_counter() - started < 0.5
+assert card is not None
+
+with pytest.raises(ValueError):
+    ISMCTSPolicy(iterations=None)
+
+# a budget too small for one iteration still plays a legal move
+game = UnoGame(3, rng=5)
+moves = list(game.legal_moves())
+for policy in (
+    ISMCTSPolicy(iterations=0), ISMCTSPolicy(iterations=None, time_limit=0)
+):
+    card, new_color = policy(game.observe(), moves, rng)
+    assert card in [move.card for move in moves]
+
+stats = simulate(3, 3, [ISMCTSPolicy(20), first_playable, first_playable], 1)
+assert stats.games == 3
+assert stats.unfinished == 0
@@ -0,0 +1,43 @@
+"""Bots for UnoGame.play_turn.
+
+A policy is a callable taking an Observation of the game from the current
+player's seat, the list of legal Moves computed by the engine and a random
+number generator, and returning the (card, new_color) to play, with card
+None to pick up. new_color is only needed for Moves with needs_color set.
+"""
+from constants import COLORS
+
+
+def first_playable(observation, moves, rng):
+    move = moves[0]
+    if move.needs_color:
+        return move.card, rng.choice(COLORS)
+    return move.card, None
+
+
+def random_playable(observation, moves, rng):
+    move = rng.choice(moves)
+    if move.needs_color:
+        return move.card, rng.choice(COLORS)
+    return move.card, None
+
+
+def lowest_playable(observation, moves, rng):
+    """Play the playable card with the lowest kind, choosing the colour
+    most held for black cards. Its choices depend only on the cards held,
+    not their order, so vector_uno.lowest_kind plays exactly the same."""
+    if moves[0].card is None:
+        return None, None
+    hand = observation.hand
+    move = min(moves, key=lambda move: hand[move.card].kind)
+    if move.needs_color:
+        counts = observation.color_counts
+        return move.card, COLORS[counts.index(max(counts))]
+    return move.card, None
+
+
+POLICIES = {
+    'first': first_playable,
+    'random': random_playable,
+    'lowest': lowest_playable,
+}
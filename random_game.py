@@ -1,6 +1,6 @@
 import random
 from uno import UnoGame
-from constants import COLORS
+from policies import first_playable
 
 players = random.randint(2 ,15)
 game = UnoGame(players)
@@ -11,19 +11,11 @@ count = 0
 while game.is_active:
     count += 1
     player = game.current_player
-    player_id = player.player_id
-    if player.can_play(game.current_card):
-        for i, card in enumerate(player.hand):
-            if game.current_card.playable(card):
-                if card.color == 'black':
-                    new_color = random.choice(COLORS)
-                else:
-                    new_color = None
-                print("Player {} played {}".format(player, card))
-                game.play(player=player_id, card=i, new_color=new_color)
-                break
-    else:
+    card, new_color = game.play_turn(first_playable)
+    if card is None:
         print("Player {} picked up".format(player))
-        game.play(player=player_id, card=None)
+    else:
+        print("Player {} played {}".format(player, card))
 
+print("Player {} wins!".format(game.winner))
 print("{} player game - {} cards played".format(players, count))
\ No newline at end of file
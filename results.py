@@ -0,0 +1,131 @@
+"""Columnar per-game and per-turn results of simulate() runs.
+
+A ResultsSink buffers one row per turn and one per game in typed arrays and
+writes them out every chunk_size turns as a pair of .npz files in a
+directory, so memory stays bounded however long the run. load_results()
+reads a directory back as one NumPy array per column:
+
+    games: game, players, turns, winner (-1 if unfinished), cards_drawn
+    turns: game, turn, seat, kind (-1 for a pick up), color (the colour id
+           chosen for a black card, otherwise -1), hand_size (after the
+           turn), drawn (cards picked up in the turn, by anyone)
+
+Requires NumPy. Run ``python simulate.py --results DIR`` to record a run.
+"""
+import os
+from array import array
+from glob import glob
+import numpy as np
+from uno import BLACK, COLOR_IDS
+
+
+CHUNK_SIZE = 1 << 20
+
+GAME_COLUMNS = {
+    'game': 'q', 'players': 'b', 'turns': 'i', 'winner': 'b',
+    'cards_drawn': 'i',
+}
+TURN_COLUMNS = {
+    'game': 'q', 'turn': 'i', 'seat': 'b', 'kind': 'b', 'color': 'b',
+    'hand_size': 'h', 'drawn': 'h',
+}
+
+
+class ResultsSink:
+    """Collect results into directory, which is created if need be. Parts
+    are numbered on from any already there, so several runs, or parts of
+    one, can share a directory."""
+    def __init__(self, directory, chunk_size=CHUNK_SIZE) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.parts = len(glob(os.path.join(directory, 'games-*.npz')))
+        self._games = {
+            name: array(code) for name, code in GAME_COLUMNS.items()
+        }
+        self._turns = {
+            name: array(code) for name, code in TURN_COLUMNS.items()
+        }
+        self._drawn = 0
+
+    def __repr__(self) -> str:
+        return '<ResultsSink object: {}>'.format(self.directory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_turn(self, game, turn, seat, card, new_color, hand_size, drawn):
+        """Record turn number turn of game number game: the seat that
+        played card, an UnoCard or None to pick up, with new_color, then
+        held hand_size cards, and drawn cards picked up."""
+        turns = self._turns
+        turns['game'].append(game)
+        turns['turn'].append(turn)
+        turns['seat'].append(seat)
+        if card is None:
+            turns['kind'].append(-1)
+            turns['color'].append(-1)
+        else:
+            turns['kind'].append(card.kind)
+            turns['color'].append(
+                COLOR_IDS[new_color] if card.color_id == BLACK else -1
+            )
+        turns['hand_size'].append(hand_size)
+        turns['drawn'].append(drawn)
+        self._drawn += drawn
+
+    def add_game(self, game, uno_game, turns):
+        """Record the end of game number game, uno_game, after turns turns.
+        Its cards drawn are those of the turns added since the last game."""
+        games = self._games
+        games['game'].append(game)
+        games['players'].append(len(uno_game.players))
+        games['turns'].append(turns)
+        winner = uno_game.winner
+        games['winner'].append(-1 if winner is None else winner.player_id)
+        games['cards_drawn'].append(self._drawn)
+        self._drawn = 0
+        if len(self._turns['game']) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write out the games and turns buffered so far as a new part."""
+        if not self._games['game'] and not self._turns['game']:
+            return
+        for table, columns in (('games', self._games), ('turns', self._turns)):
+            np.savez(
+                os.path.join(
+                    self.directory, '{}-{:05d}.npz'.format(table, self.parts)
+                ),
+                **{
+                    name: np.frombuffer(column, column.typecode)
+                    for name, column in columns.items()
+                }
+            )
+            for name in columns:
+                columns[name] = array(columns[name].typecode)
+        self.parts += 1
+
+    def close(self):
+        self.flush()
+
+
+def load_results(directory):
+    """Return the (games, turns) tables in directory, each a dict of NumPy
+    arrays by column name."""
+    tables = []
+    for table, columns in (('games', GAME_COLUMNS), ('turns', TURN_COLUMNS)):
+        parts = []
+        for path in sorted(glob(os.path.join(directory, table + '-*.npz'))):
+            with np.load(path) as part:
+                parts.append({name: part[name] for name in columns})
+        tables.append({
+            name: np.concatenate(
+                [part[name] for part in parts] or [np.zeros(0, code)]
+            )
+            for name, code in columns.items()
+        })
+    return tuple(tables)
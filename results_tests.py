@@ -0,0 +1,64 @@
+import os
+import tempfile
+import pytest
+np = pytest.importorskip('numpy')
+from policies import first_playable, random_playable
+from simulate import simulate
+from results import *
+
+
+directory = tempfile.mkdtemp()
+whole = os.path.join(directory, 'whole')
+chunked = os.path.join(directory, 'chunked')
+
+with ResultsSink(whole) as sink:
+    stats = simulate(4, 60, random_playable, seed=4, max_turns=300, sink=sink)
+with ResultsSink(chunked, chunk_size=500) as sink:
+    simulate(4, 60, random_playable, seed=4, max_turns=300, sink=sink)
+    assert sink.parts > 1
+assert len(os.listdir(whole)) == 2
+assert len(os.listdir(chunked)) == 2 * sink.parts
+
+games, turns = load_results(whole)
+assert set(games) == set(GAME_COLUMNS)
+assert set(turns) == set(TURN_COLUMNS)
+assert games['game'].tolist() == list(range(60))
+assert (games['players'] == 4).all()
+assert games['turns'].sum() == stats.turns == len(turns['game'])
+assert games['cards_drawn'].sum() == stats.cards_drawn
+assert (games['winner'] == -1).sum() == stats.unfinished
+assert np.bincount(
+    games['winner'][games['winner'] >= 0], minlength=4
+).tolist() == stats.wins
+assert turns['drawn'].sum() == stats.cards_drawn
+assert np.array_equal(np.bincount(turns['game']), games['turns'])
+
+# colours are only chosen for black cards
+black = turns['kind'] >= 52
+assert (turns['color'][black] >= 0).all()
+assert (turns['color'][~black] == -1).all()
+# a pick up is drawn, a +4 makes the next player pick up 4
+assert (turns['drawn'][turns['kind'] == -1] >= 0).all()
+assert (turns['drawn'][turns['kind'] == 53] <= 4).all()
+
+first = turns['turn'] == 0
+assert (turns['seat'][first] == 0).all()
+assert (turns['hand_size'][first & (turns['kind'] >= 0)] == 6).all()
+
+# chunks read back as the same tables
+chunked_games, chunked_turns = load_results(chunked)
+for table, other in ((games, chunked_games), (turns, chunked_turns)):
+    for name in table:
+        assert table[name].dtype == other[name].dtype
+        assert np.array_equal(table[name], other[name])
+
+# parts are added to a directory already in use
+with ResultsSink(whole) as sink:
+    simulate(2, 5, first_playable, seed=1, sink=sink)
+games, turns = load_results(whole)
+assert len(games['game']) == 65
+assert (games['players'][60:] == 2).all()
+
+games, turns = load_results(os.path.join(directory, 'missing'))
+assert len(games['game']) == 0
+assert turns['kind'].dtype == np.int8
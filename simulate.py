@@ -0,0 +1,244 @@
+"""Headless batch simulation of Uno games.
+
+Each seat is played by a policy from policies.py, or any other callable
+following the same interface.
+
+Run ``python simulate.py --players 4 --games 10000`` for statistics, adding
+``--benchmark`` to report throughput instead.
+"""
+import argparse
+import cProfile
+import pstats
+from contextlib import ExitStack
+from random import Random
+from time import perf_counter
+from uno import UnoGame, DECK
+from gamelog import GameLogWriter
+from instrument import PhaseTimer, print_phases
+from policies import POLICIES, first_playable
+
+
+MAX_TURNS = 10000
+
+
+class SimulationStats:
+    def __init__(self, players) -> None:
+        self.players = players
+        self.games = 0
+        self.unfinished = 0
+        self.turns = 0
+        self.min_turns = None
+        self.max_turns = 0
+        self.cards_drawn = 0
+        self.wins = [0] * players
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return '<SimulationStats object: {} games of {} players>'.format(
+            self.games, self.players
+        )
+
+    def merge(self, other):
+        """Add the results of other, another run with the same number of
+        players, into these stats. seconds becomes the total time spent."""
+        if other.players != self.players:
+            raise ValueError('Invalid stats: number of players differs')
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.turns += other.turns
+        if other.min_turns is not None and (
+            self.min_turns is None or other.min_turns < self.min_turns
+        ):
+            self.min_turns = other.min_turns
+        self.max_turns = max(self.max_turns, other.max_turns)
+        self.cards_drawn += other.cards_drawn
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.seconds += other.seconds
+
+    def add_game(self, game, turns, cards_played):
+        self.games += 1
+        self.turns += turns
+        if self.min_turns is None or turns < self.min_turns:
+            self.min_turns = turns
+        if turns > self.max_turns:
+            self.max_turns = turns
+        in_hands = sum(len(player.hand) for player in game.players)
+        self.cards_drawn += in_hands + cards_played - 7 * self.players
+        if game.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[game.winner.player_id] += 1
+
+    @property
+    def mean_turns(self):
+        return self.turns / self.games if self.games else 0.0
+
+    @property
+    def win_rates(self):
+        games = max(self.games, 1)
+        return [wins / games for wins in self.wins]
+
+    @property
+    def games_per_second(self):
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def turns_per_second(self):
+        return self.turns / self.seconds if self.seconds else 0.0
+
+
+def game_rng(seed, index):
+    """Return the random number generator for game number index of a run
+    seeded with seed. The same (seed, index) always gives the same game."""
+    if seed is None:
+        return Random()
+    return Random('{}:{}'.format(seed, index))
+
+
+def play_game(game, policies, rng, max_turns=MAX_TURNS, sink=None, index=0):
+    """Play game until it is won or max_turns have been taken, and return
+    the number of turns taken and cards played. Every turn and the result
+    are added to sink, a results.ResultsSink, as game number index. The
+    game's hooks are told if it is stopped unwon."""
+    turns = cards_played = 0
+    while game.is_active and turns < max_turns:
+        player = game.current_player
+        policy = policies[player.player_id]
+        if sink is not None:
+            held = len(DECK) - len(game.draw_pile) - len(game.discard_pile)
+        card, new_color = game.play_turn(policy, rng)
+        if card is not None:
+            cards_played += 1
+        if sink is not None:
+            drawn = (
+                len(DECK) - len(game.draw_pile) - len(game.discard_pile) -
+                held + (card is not None)
+            )
+            sink.add_turn(
+                index, turns, player.player_id, card, new_color,
+                len(player.hand), drawn
+            )
+        turns += 1
+    if game.is_active and game.hooks is not None:
+        game.hooks.game_stopped(game)
+    if sink is not None:
+        sink.add_game(index, game, turns)
+    return turns, cards_played
+
+
+def simulate(players, games, policies=first_playable, seed=None,
+             max_turns=MAX_TURNS, start=0, log=None, sink=None, hooks=None):
+    """Play games games of players players without any output and return
+    their SimulationStats. policies is a single policy used by every seat
+    or a list with one policy per seat. Games are numbered from start, so
+    a run can be split into parts that together play the same games. Each
+    game is recorded by log, a gamelog.GameLogWriter, its results added to
+    sink, a results.ResultsSink, and its events passed to hooks, an
+    instrument.GameHooks, if given."""
+    if callable(policies):
+        policies = [policies] * players
+    if len(policies) != players:
+        raise ValueError('Invalid policies: must be one per player')
+    stats = SimulationStats(players)
+    started = perf_counter()
+    for i in range(start, start + games):
+        rng = game_rng(seed, i)
+        game = UnoGame(players, rng=rng, log=log, hooks=hooks)
+        turns, cards_played = play_game(
+            game, policies, rng, max_turns, sink, i
+        )
+        stats.add_game(game, turns, cards_played)
+    stats.seconds = perf_counter() - started
+    return stats
+
+
+def print_stats(stats):
+    print('{} player games: {}, unfinished: {}'.format(
+        stats.players, stats.games, stats.unfinished
+    ))
+    print('Turns: mean {:.1f}, min {}, max {}'.format(
+        stats.mean_turns, stats.min_turns, stats.max_turns
+    ))
+    print('Cards drawn: {} ({:.1f} per game)'.format(
+        stats.cards_drawn, stats.cards_drawn / max(stats.games, 1)
+    ))
+    for seat, rate in enumerate(stats.win_rates):
+        print('Player {} win rate: {:.3f}'.format(seat, rate))
+
+
+def print_benchmark(stats):
+    print('{} games, {} turns in {:.3f}s'.format(
+        stats.games, stats.turns, stats.seconds
+    ))
+    print('{:.1f} games/sec, {:.1f} turns/sec'.format(
+        stats.games_per_second, stats.turns_per_second
+    ))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--policy', choices=sorted(POLICIES), default=['first'], nargs='+',
+        help='policy for every seat, or one per seat'
+    )
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument(
+        '--benchmark', action='store_true',
+        help='report games/sec and turns/sec instead of game statistics'
+    )
+    parser.add_argument(
+        '--log', metavar='PATH', help='record every game to a gamelog file'
+    )
+    parser.add_argument(
+        '--results', metavar='DIR',
+        help='write per-game and per-turn results as .npz files (NumPy)'
+    )
+    parser.add_argument(
+        '--phases', action='store_true',
+        help='print the time spent in each phase of a turn'
+    )
+    parser.add_argument(
+        '--profile', type=int, nargs='?', const=25, metavar='N',
+        help='print the N (default 25) slowest functions under cProfile'
+    )
+    args = parser.parse_args(args)
+    policies = [POLICIES[name] for name in args.policy]
+    if len(policies) == 1:
+        policies = policies[0]
+    with ExitStack() as stack:
+        log = sink = None
+        if args.log is not None:
+            log = stack.enter_context(GameLogWriter(args.log))
+        if args.results is not None:
+            # results.py needs NumPy, so it is only imported when used
+            from results import ResultsSink
+            sink = stack.enter_context(ResultsSink(args.results))
+        hooks = PhaseTimer() if args.phases else None
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler is not None:
+            profiler.enable()
+        stats = simulate(
+            args.players, args.games, policies, args.seed, args.max_turns,
+            log=log, sink=sink, hooks=hooks
+        )
+        if profiler is not None:
+            profiler.disable()
+    if args.benchmark:
+        print_benchmark(stats)
+    else:
+        print_stats(stats)
+    if hooks is not None:
+        print()
+        print_phases(hooks)
+    if profiler is not None:
+        print()
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(
+            args.profile
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import pytest
+from uno import UnoGame
+from policies import first_playable, random_playable
+from simulate import *
+
+
+stats = simulate(4, 50, seed=1)
+assert stats.games == 50
+assert stats.unfinished == 0
+assert sum(stats.wins) == 50
+assert abs(sum(stats.win_rates) - 1) < 1e-9
+assert stats.min_turns <= stats.mean_turns <= stats.max_turns
+assert stats.cards_drawn > 0
+assert stats.seconds > 0
+
+stats2 = simulate(4, 50, seed=1)
+assert stats2.wins == stats.wins
+assert stats2.turns == stats.turns
+assert stats2.cards_drawn == stats.cards_drawn
+
+stats = simulate(3, 20, [first_playable, random_playable, first_playable], 2)
+assert stats.games == 20
+
+with pytest.raises(ValueError):
+    simulate(3, 1, [first_playable, random_playable])
+
+stats = simulate(2, 5, seed=1, max_turns=1)
+assert stats.unfinished == 5
+assert stats.turns == 5
+
+rng = game_rng(1, 0)
+game = UnoGame(2, rng=rng)
+turns, cards_played = play_game(game, [first_playable] * 2, rng)
+assert not game.is_active
+assert game.winner is not None
+assert len(game.winner.hand) == 0
+
+stats = simulate(4, 30, seed=7, start=0)
+stats.merge(simulate(4, 20, seed=7, start=30))
+whole = simulate(4, 50, seed=7)
+assert stats.games == 50
+assert stats.wins == whole.wins
+assert stats.turns == whole.turns
+assert stats.min_turns == whole.min_turns
+assert stats.max_turns == whole.max_turns
+
+with pytest.raises(ValueError):
+    stats.merge(SimulationStats(3))
+
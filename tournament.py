@@ -0,0 +1,110 @@
+"""Parallel tournaments: simulate.py runs sharded across a process pool.
+
+Games are numbered and seeded exactly as in simulate(), so a tournament
+gives the same statistics whatever the number of workers or shard size.
+
+Run ``python tournament.py --players 4 --games 1000000`` to use every core.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from random import Random
+from time import perf_counter
+from policies import POLICIES, first_playable
+from simulate import MAX_TURNS, SimulationStats, simulate
+from simulate import print_stats, print_benchmark
+
+
+SHARD_SIZE = 2000
+
+
+def shards(games, shard_size=SHARD_SIZE):
+    """Split games into (start, count) shards of at most shard_size."""
+    return [
+        (start, min(shard_size, games - start))
+        for start in range(0, games, shard_size)
+    ]
+
+
+def iter_tournament(players, games, policies=first_playable, seed=None,
+                    workers=None, shard_size=SHARD_SIZE, max_turns=MAX_TURNS):
+    """Play games games across workers processes, yielding the merged
+    SimulationStats of all the shards finished so far each time one
+    completes. Policies must be module level functions so they can be sent
+    to the worker processes. Closing the generator early cancels the shards
+    not yet started."""
+    if seed is None:
+        seed = Random().getrandbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    stats = SimulationStats(players)
+    start = perf_counter()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(
+                simulate, players, count, policies, seed, max_turns, first
+            )
+            for first, count in shards(games, shard_size)
+        ]
+        for future in as_completed(futures):
+            shard = future.result()
+            shard.seconds = 0.0
+            stats.merge(shard)
+            stats.seconds = perf_counter() - start
+            yield stats
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def run_tournament(players, games, policies=first_playable, seed=None,
+                   workers=None, shard_size=SHARD_SIZE, max_turns=MAX_TURNS):
+    """Play a whole tournament and return its merged SimulationStats, with
+    seconds set to the wall clock time taken."""
+    stats = SimulationStats(players)
+    for stats in iter_tournament(
+        players, games, policies, seed, workers, shard_size, max_turns
+    ):
+        pass
+    return stats
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--policy', choices=sorted(POLICIES), default=['first'], nargs='+',
+        help='policy for every seat, or one per seat'
+    )
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE)
+    parser.add_argument(
+        '--benchmark', action='store_true',
+        help='report games/sec and turns/sec instead of game statistics'
+    )
+    parser.add_argument(
+        '--progress', action='store_true',
+        help='print the number of games played as shards complete'
+    )
+    args = parser.parse_args(args)
+    policies = [POLICIES[name] for name in args.policy]
+    if len(policies) == 1:
+        policies = policies[0]
+    stats = SimulationStats(args.players)
+    for stats in iter_tournament(
+        args.players, args.games, policies, args.seed, args.workers,
+        args.shard_size, args.max_turns
+    ):
+        if args.progress:
+            print('{}/{} games'.format(stats.games, args.games))
+    if args.benchmark:
+        print_benchmark(stats)
+    else:
+        print_stats(stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+from time import perf_counter
+from simulate import simulate
+from tournament import *
+
+assert shards(10, 4) == [(0, 4), (4, 4), (8, 2)]
+assert shards(0, 4) == []
+
+
+# the workers of the spawn and forkserver start methods import this module
+# again, so only the main process starts pools
+if __name__ == '__main__':
+    whole = simulate(4, 50, seed=7)
+    stats = run_tournament(4, 50, seed=7, workers=2, shard_size=15)
+    assert stats.games == 50
+    assert stats.wins == whole.wins
+    assert stats.turns == whole.turns
+    assert stats.cards_drawn == whole.cards_drawn
+
+    progress = [
+        stats.games for stats in iter_tournament(3, 25, seed=1, shard_size=10)
+    ]
+    assert len(progress) == 3
+    assert progress[-1] == 25
+
+    # stopping after the first shard does not wait for the other 199
+    started = perf_counter()
+    tournament = iter_tournament(
+        4, 20000, seed=1, workers=1, shard_size=100
+    )
+    assert next(tournament).games == 100
+    tournament.close()
+    assert perf_counter() - started < 5
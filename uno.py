@@ -1,14 +1,57 @@
-from random import shuffle, choice
+import random as _random
+from random import Random
 from itertools import product, repeat, chain
+from collections import namedtuple
 from constants import COLORS, ALL_COLORS, NUMBERS, SPECIAL_CARD_TYPES
 from constants import COLOR_CARD_TYPES, BLACK_CARD_TYPES, CARD_TYPES
+from policies import first_playable
+
+
+# Integer encoding of the card faces. Colours and card types are numbered in
+# the order of ALL_COLORS and of the distinct CARD_TYPES; a card's kind is its
+# index into KINDS: the 52 coloured faces first, then the two black ones.
+COLOR_IDS = {color: i for i, color in enumerate(ALL_COLORS)}
+BLACK = COLOR_IDS['black']
+TYPES = list(range(10)) + SPECIAL_CARD_TYPES + BLACK_CARD_TYPES
+TYPE_IDS = {card_type: i for i, card_type in enumerate(TYPES)}
+KINDS = tuple(product(COLORS, TYPES[:13])) + tuple(
+    ('black', card_type) for card_type in BLACK_CARD_TYPES
+)
+KIND_IDS = {face: kind for kind, face in enumerate(KINDS)}
+
+
+def _playable_kinds(color_id, type_id):
+    mask = 0
+    for kind, (color, card_type) in enumerate(KINDS):
+        if (
+            COLOR_IDS[color] in (color_id, BLACK) or
+            TYPE_IDS[card_type] == type_id
+        ):
+            mask |= 1 << kind
+    return mask
+
+
+# Legality table: a card's state numbers its (effective colour, type) pair and
+# bit k of PLAYABLE[state] is set when a card of kind k may be played on it.
+PLAYABLE = tuple(
+    _playable_kinds(color_id, type_id)
+    for color_id in range(len(ALL_COLORS))
+    for type_id in range(len(TYPES))
+)
 
 
 class UnoCard:
+    __slots__ = (
+        'color', 'card_type', 'kind', 'color_id', 'type_id',
+        '_color_id', '_temp_color', 'state',
+    )
+
     def __init__(self, color, card_type) -> None:
-        self._validate(color, card_type)
+        self.kind = self._validate(color, card_type)
         self.color = color
         self.card_type = card_type
+        self.color_id = COLOR_IDS[color]
+        self.type_id = TYPE_IDS[card_type]
         self.temp_color = None
         
     def __repr__(self) -> str:
@@ -17,16 +60,23 @@ class UnoCard:
     def __str__(self) -> str:
         return '{}{}'.format(self.color_short, self.card_type_short)
     
+    def __format__(self, f) -> str:
+        if f == 'full':
+            return '{} {}'.format(self._color, self.card_type)
+        else:
+            return str(self)
+        
     def __eq__(self, other) -> bool:
-        return self.color == other.color and self.card_type == other.card_type
+        return self.kind == other.kind
     
     def _validate(self, color, card_type):
+        try:
+            return KIND_IDS[color, card_type]
+        except (KeyError, TypeError):
+            pass
         if color not in ALL_COLORS:
             raise ValueError('Invalid color')
-        if color == 'black' and card_type not in BLACK_CARD_TYPES:
-            raise ValueError('Invalid card type')
-        if color != 'black' and card_type not in COLOR_CARD_TYPES:
-            raise ValueError('Invalid card type')
+        raise ValueError('Invalid card type')
     
     @property
     def color_short(self):
@@ -41,7 +91,7 @@ class UnoCard:
     
     @property
     def _color(self):
-        return self.temp_color if self.temp_color else self. color
+        return self.temp_color if self.temp_color else self.color
     
     @property
     def temp_color(self):
@@ -50,16 +100,46 @@ class UnoCard:
     @temp_color.setter
     def temp_color(self, color):
         if color is not None:
-            if color is not COLORS:
+            if color not in COLORS:
                 raise ValueError('Invalid color')
+            self._color_id = COLOR_IDS[color]
+        else:
+            self._color_id = self.color_id
         self._temp_color = color
+        self.state = self._color_id * len(TYPES) + self.type_id
     
     def playable(self, other):
-        return(
-            self._color == other.color or
-            self.card_type == other.card_type or
-            other.color == 'black'
-        )
+        return PLAYABLE[self.state] >> other.kind & 1 == 1
+
+
+# Interned cards shared by every game: CARDS[kind] is the face with that kind
+# and DECK is the full 108 card pack in the order UnoGame deals it unshuffled.
+# Cards in play are never mutated; a black card on top of the discard pile is
+# replaced by its entry in COLORED_BLACK_CARDS[kind][color] instead.
+CARDS = tuple(UnoCard(color, card_type) for color, card_type in KINDS)
+DECK = tuple(
+    CARDS[KIND_IDS[face]] for face in chain(
+        product(COLORS, COLOR_CARD_TYPES),
+        product(repeat('black', 4), BLACK_CARD_TYPES),
+    )
+)
+
+
+def _colored(card, color):
+    card = UnoCard(card.color, card.card_type)
+    card.temp_color = color
+    return card
+
+
+COLORED_BLACK_CARDS = {
+    card.kind: {color: _colored(card, color) for color in COLORS}
+    for card in CARDS if card.color_id == BLACK
+}
+
+_SKIP, _REVERSE, _DRAW_TWO, _DRAW_FOUR = (
+    TYPE_IDS[card_type] for card_type in ('skip', 'reverse', '+2', '+4')
+)
+_PENALTIES = {_DRAW_TWO: 2, _DRAW_FOUR: 4}
 
 
 class UnoPlayer:
@@ -73,8 +153,12 @@ class UnoPlayer:
                 'Invalid player: cards must all be UnoCards object'
             )
         
-        self.hand = cards
+        self.hand = []
         self.player_id = player_id
+        self.kind_counts = [0] * len(KINDS)
+        self.color_counts = [0] * len(ALL_COLORS)
+        self.hand_mask = 0
+        self.add_cards(cards)
     
     def __repr__(self) -> str:
         if self.player_id is not None:
@@ -89,88 +173,355 @@ class UnoPlayer:
             return repr(self)
         
     def can_play(self, current_card):
-        return any(current_card.playable(card) for card in self.hand)
+        return PLAYABLE[current_card.state] & self.hand_mask != 0
+
+    def playable_cards(self, current_card):
+        """Return the indices of the cards in hand that can be played on
+        current_card, in hand order."""
+        legal = PLAYABLE[current_card.state] & self.hand_mask
+        if not legal:
+            return []
+        # one pass testing a bit of legal per card beats looking each
+        # legal kind up in the hand, which compares UnoCards
+        return [
+            i for i, card in enumerate(self.hand) if legal >> card.kind & 1
+        ]
+
+    def add_cards(self, cards):
+        """Add cards to the hand, keeping the hand index up to date. The
+        hand must only be changed through add_cards and remove_card."""
+        for card in cards:
+            kind = card.kind
+            self.kind_counts[kind] += 1
+            self.color_counts[card.color_id] += 1
+            self.hand_mask |= 1 << kind
+        self.hand.extend(cards)
+
+    def remove_card(self, index):
+        card = self.hand.pop(index)
+        kind = card.kind
+        self.kind_counts[kind] -= 1
+        self.color_counts[card.color_id] -= 1
+        if not self.kind_counts[kind]:
+            self.hand_mask &= ~(1 << kind)
+        return card
+
+    def replace_hand(self, cards):
+        """Swap the whole hand for cards, rebuilding the hand index."""
+        self.hand.clear()
+        self.kind_counts[:] = [0] * len(KINDS)
+        self.color_counts[:] = [0] * len(ALL_COLORS)
+        self.hand_mask = 0
+        self.add_cards(cards)
+
+    def snapshot(self):
+        """Return the hand and its index as a tuple for restore()."""
+        return (
+            tuple(self.hand), tuple(self.kind_counts),
+            tuple(self.color_counts), self.hand_mask,
+        )
+
+    def restore(self, state):
+        hand, kind_counts, color_counts, self.hand_mask = state
+        self.hand[:] = hand
+        self.kind_counts[:] = kind_counts
+        self.color_counts[:] = color_counts
+
+    def copy(self):
+        player = UnoPlayer.__new__(UnoPlayer)
+        player.hand = self.hand[:]
+        player.player_id = self.player_id
+        player.kind_counts = self.kind_counts[:]
+        player.color_counts = self.color_counts[:]
+        player.hand_mask = self.hand_mask
+        return player
   
   
-class ReversibleCycle:
+class TurnOrder:
+    """The seats around a table: whose turn it is and the direction of
+    play. Moving any number of seats is a single modular step."""
+    def __init__(self, items, position=0, direction=1) -> None:
+        self._items = list(items)
+        self.position = position % len(self._items)
+        self.direction = direction
+
+    @property
+    def current(self):
+        return self._items[self.position]
+
+    def peek(self, k=1):
+        """Return the item k seats on in the direction of play."""
+        return self._items[
+            (self.position + k * self.direction) % len(self._items)
+        ]
+
+    def advance(self, k=1):
+        """Move k seats on in the direction of play and return that item."""
+        self.position = (
+            (self.position + k * self.direction) % len(self._items)
+        )
+        return self._items[self.position]
+
+    def reverse(self):
+        self.direction = -self.direction
+
+
+class ReversibleCycle(TurnOrder):
+    """Iterate over items forever, forwards or backwards. The first item
+    returned is the first, or the last when reversed before starting."""
     def __init__(self, iterable) -> None:
-        self._item = list(iterable)  
-        self._pos = None
-        self._reverse = False
+        super().__init__(iterable)
+        self._started = False
     
     def __iter__(self):
         return self
     
     def __next__(self):
-        if self.pos is None:
-            self.pos = -1 if self._reverse else 0 
-        else:
-            self.pos = self.pos + self._delta
-        return self._items [self.pos]
-    
-    @property
-    def _delta(self):
-        return -1 if self._reverse else 1
-    
-    @property
-    def pos(self):
-        return self._pos
-    
-    @pos.setter
-    def pos(self, value):
-        self._pos = value % len(self._items)
-        
-    def reverse(self):
-        self._reverse = not self._reverse
+        if self._started:
+            return self.advance()
+        self._started = True
+        if self.direction < 0:
+            self.position = len(self._items) - 1
+        return self.current
  
        
+# A legal move for the current player: the hand index of a playable card, or
+# None to pick up, and whether a new colour must be chosen to play it.
+Move = namedtuple('Move', ['card', 'needs_color'])
+PICK_UP = Move(None, False)
+
+# A move as the (kind, color) played: the kind of the card, or None to pick
+# up, and the colour chosen for a black card, otherwise None. Unlike a Move's
+# hand index, an action means the same in any game dealing the same cards.
+PICK_UP_ACTION = (None, None)
+
+
+class Observation:
+    """What the current player of a game can see: their own hand and the
+    public state of the table. A live view, only valid until the next move
+    is played."""
+    __slots__ = ('_game', '_player')
+
+    def __init__(self, game) -> None:
+        self._game = game
+        self._player = game.current_player
+
+    def __repr__(self) -> str:
+        return '<Observation object: player {}>'.format(self.player_id)
+
+    @property
+    def player_id(self):
+        return self._player.player_id
+
+    @property
+    def hand(self):
+        return tuple(self._player.hand)
+
+    @property
+    def color_counts(self):
+        """How many cards of each of COLORS are in the hand."""
+        return tuple(self._player.color_counts[:BLACK])
+
+    @property
+    def current_card(self):
+        return self._game.current_card
+
+    @property
+    def current_color(self):
+        return self._game.current_card._color
+
+    @property
+    def hand_sizes(self):
+        return tuple(len(player.hand) for player in self._game.players)
+
+    @property
+    def direction(self):
+        return self._game.direction
+
+    @property
+    def draw_pile_size(self):
+        return len(self._game.draw_pile)
+
+    @property
+    def discard_pile(self):
+        return tuple(self._game.discard_pile)
+
+
+def make_rng(rng=None):
+    """Return the random.Random for rng: a seed, a NumPy Generator, which
+    seeds a new Random from its stream, or a Random, or anything else with
+    its shuffle() and choice() methods, used as it is. None gives the random
+    module itself, shared by every game unseeded."""
+    if rng is None:
+        return _random
+    if hasattr(rng, 'bit_generator'):
+        return Random(int(rng.integers(2 ** 63)))
+    if hasattr(rng, 'shuffle'):
+        return rng
+    return Random(rng)
+
+
+# An immutable copy of a game position. Cards are the shared CARDS and
+# COLORED_BLACK_CARDS, hands are UnoPlayer.snapshot() tuples and winner is a
+# player index. color is the colour id of the top card, which its restored
+# discard pile already gives: it is kept because cards compare by kind only,
+# so without it positions differing in a black card's colour compare equal.
+# The random number generator is not part of the state.
+GameState = namedtuple('GameState', [
+    'draw_pile', 'discard_pile', 'hands', 'position', 'direction', 'winner',
+    'color',
+])
+
+
 class UnoGame:
-    def __init__(self, players, random=True) -> None:
+    def __init__(self, players, random=True, rng=None, history=False,
+                 log=None, hooks=None, color_first_card=False) -> None:
         if not isinstance(players, int):
             raise ValueError('Invalid game: players must be integer')
         if not 2 <= players <= 15:
             raise ValueError('Invalid game: must be between 2 and 15 players')
 
-        self.deck = self._create_deck(random)
+        self._random = random
+        self._rng = make_rng(rng)
+        # a gamelog.GameLogWriter recording the deals and moves
+        self._log = log
+        if log is not None:
+            log.start(players, random, color_first_card)
+        self.draw_pile = self._create_deck(random)
         self.players = [
             UnoPlayer(self._deal_hand(), n) for n in range(players)
         ]
-        self._player_cycle = ReversibleCycle(self.players)
-        self._current_player = next(self._player_cycle)  # current yazımı düzeltildi
+        self.discard_pile = [self.draw_pile.pop()]
+        # the draw pile is drawn from the end, so the card dealt last after
+        # the first discard is the first one picked up
+        self.draw_pile.reverse()
+        if color_first_card:
+            self._check_first_card()
+        self._turn_order = TurnOrder(self.players)
         self._winner = None
+        self._history = [] if history else None
+        # an instrument.GameHooks told of every turn, draw and reshuffle
+        self._hooks = hooks
+        if hooks is not None:
+            hooks.game_start(self)
 
     def __next__(self):
-        self._current_player = next(self._player_cycle)
+        self._turn_order.advance()
         
     def _create_deck(self, random):
-        color_cards = product(COLORS, COLOR_CARD_TYPES)
-        black_cards = product(repeat('black', 4), BLACK_CARD_TYPES)
-        all_cards = chain(color_cards, black_cards)
-        deck = [UnoCard(color, card_type) for color, card_type in all_cards]
+        deck = list(DECK)
         if random:
-            shuffle(deck)
+            self._shuffle(deck)
             return deck
         else:
             return list(reversed(deck))
 
     def _deal_hand(self):
-        return [self.deck.pop() for i in range(7)]
+        return [self.draw_pile.pop() for i in range(7)]
+
+    @property
+    def deck(self):
+        """All cards not in a hand, bottom of the draw pile first and the
+        current card last."""
+        return self.draw_pile[::-1] + self.discard_pile
 
     @property
     def current_card(self):
-        return self.deck[-1]
+        return self.discard_pile[-1]
     
     @property
     def is_active(self):
-        return all(len(player.hand) > 0 for player in self.players)
+        return self._winner is None
     
     @property
     def current_player(self):
-        return self._current_player
+        return self._turn_order.current
+
+    @property
+    def next_player(self):
+        return self._turn_order.peek()
+
+    @property
+    def direction(self):
+        """1 while play goes up the player numbers, -1 once reversed."""
+        return self._turn_order.direction
     
     @property
     def winner(self):
         return self._winner
+
+    @property
+    def turn_order(self):
+        return self._turn_order
+
+    @property
+    def rng(self):
+        return self._rng
+
+    @property
+    def hooks(self):
+        return self._hooks
+
+    def legal_moves(self):
+        """Generate the current player's legal Moves in hand order. Picking
+        up is only offered when no card can be played."""
+        player = self.current_player
+        playable = player.playable_cards(self.current_card)
+        if not playable:
+            yield PICK_UP
+            return
+        hand = player.hand
+        for card in playable:
+            yield Move(card, hand[card].color_id == BLACK)
+
+    def legal_actions(self):
+        """Return the current player's legal actions in kind order: one per
+        playable kind, one per colour of COLORS for black kinds, or only
+        PICK_UP_ACTION when no card can be played."""
+        legal = PLAYABLE[self.current_card.state]
+        legal &= self.current_player.hand_mask
+        if not legal:
+            return [PICK_UP_ACTION]
+        actions = []
+        while legal:
+            kind = (legal & -legal).bit_length() - 1
+            legal &= legal - 1
+            if CARDS[kind].color_id == BLACK:
+                actions.extend((kind, color) for color in COLORS)
+            else:
+                actions.append((kind, None))
+        return actions
+
+    def play_action(self, action):
+        """Play action for the current player, playing the first card of
+        its kind in their hand."""
+        player = self.current_player
+        kind, color = action
+        if kind is None:
+            self.play(player.player_id, None)
+        else:
+            self.play(player.player_id, player.hand.index(CARDS[kind]), color)
+
+    def observe(self):
+        return Observation(self)
+
+    def play_turn(self, policy, rng=None):
+        """Play the current player's turn with policy (see policies.py),
+        which is given their Observation, the legal moves and rng (see
+        make_rng), or else this game's random number generator. Return the
+        card played, or None if they picked up, and the colour chosen."""
+        rng = self._rng if rng is None else make_rng(rng)
+        player = self.current_player
+        if self._hooks is not None:
+            self._hooks.turn_start(self, player)
+        moves = list(self.legal_moves())
+        card, new_color = policy(Observation(self), moves, rng)
+        if card is None:
+            self.play(player.player_id, None)
+            return None, None
+        played_card = player.hand[card]
+        self.play(player.player_id, card, new_color)
+        return played_card, new_color
     
     def play(self, player, card=None, new_color=None):
         if not isinstance(player, int):
@@ -180,9 +531,16 @@ class UnoGame:
         _player = self.players[player]
         if self.current_player != _player:
             raise ValueError('Invalid player: not their turn')
+        if not self.is_active:
+            raise ValueError('Game is over')
         if card is None:
+            self._save()
+            if self._log is not None:
+                self._log.play(None)
             self._pick_up(_player, 1)
             next(self)
+            if self._hooks is not None:
+                self._hooks.turn_end(self, _player)
             return
         _card = _player.hand[card]
         if not self.current_card.playable(_card):
@@ -191,38 +549,140 @@ class UnoGame:
                     _card, self.current_card
                     )
                 )
-        if _card.color == 'black':
+        if _card.color_id == BLACK:
             if new_color not in COLORS:
                 raise ValueError(
                     'Invalid new_color: must be red, yellow, green or blue'
                 )
-        if not self.is_active:
-            raise ValueError('Game is over')
-        
-        played_card = _player.hand.pop(card)
-        self.deck.append(played_card)
+
+        self._save()
+        if self._log is not None:
+            self._log.play(
+                card, COLOR_IDS[new_color] if _card.color_id == BLACK else None
+            )
+        played_card = _player.remove_card(card)
+        self.discard_pile.append(played_card)
+        hooks = self._hooks
+        if hooks is not None:
+            hooks.card_played(self, _player, played_card)
         
-        card_color = played_card.color
-        card_type = played_card.card_type
-        if card_color == 'black':
-            self.current_card.temp_color =new_color
-            if card_type == '+4':
-                next(self)
-                self._pick_up(self.current_player, 4)
-        elif card_type == 'reverse':
-            self._player_cycle._reverse()
-        elif card_type == 'skip':
-            next(self)
-        elif card_type == '+2':
-            next(self)
-            self._pick_up(self.current_player, 2)
-            
-        if self.is_active:
-            next(self)
+        card_type = played_card.type_id
+        if played_card.color_id == BLACK:
+            self.discard_pile[-1] = (
+                COLORED_BLACK_CARDS[played_card.kind][new_color]
+            )
+        skips = 0
+        if card_type == _REVERSE:
+            self._turn_order.reverse()
+        elif card_type == _SKIP:
+            skips = 1
+        elif card_type in _PENALTIES:
+            skips = 1
+            self._pick_up(self.next_player, _PENALTIES[card_type])
+
+        # only the player who has just played can have emptied their hand
+        if _player.hand:
+            self._turn_order.advance(skips + 1)
         else:
-            self_winner = _player
-            self._print_winner()
+            self._turn_order.advance(skips)
+            self._winner = _player
+            if self._log is not None:
+                self._log.end(player)
+        if hooks is not None:
+            hooks.turn_end(self, _player)
+            if self._winner is not None:
+                hooks.game_end(self, _player)
             
+    def snapshot(self):
+        """Return the current position as a GameState."""
+        turn_order = self._turn_order
+        return GameState(
+            tuple(self.draw_pile),
+            tuple(self.discard_pile),
+            tuple(player.snapshot() for player in self.players),
+            turn_order.position,
+            turn_order.direction,
+            None if self._winner is None else self.players.index(self._winner),
+            self.current_card._color_id,
+        )
+
+    def restore(self, state):
+        """Return to a position taken with snapshot()."""
+        if len(state.hands) != len(self.players):
+            raise ValueError('Invalid state: wrong number of players')
+        self.draw_pile[:] = state.draw_pile
+        self.discard_pile[:] = state.discard_pile
+        for player, hand in zip(self.players, state.hands):
+            player.restore(hand)
+        self._turn_order.position = state.position
+        self._turn_order.direction = state.direction
+        if state.winner is None:
+            self._winner = None
+        else:
+            self._winner = self.players[state.winner]
+
+    def clone(self, rng=None):
+        """Return an independent copy of the game. It shuffles with rng if
+        given, or else a copy of this game's random number generator, and
+        is neither logged nor instrumented. A generator without a state to
+        copy, such as a SystemRandom, is shared."""
+        game = UnoGame.__new__(UnoGame)
+        game._random = self._random
+        if rng is None:
+            rng = self._rng
+            try:
+                state = None if rng is _random else rng.getstate()
+            except (AttributeError, NotImplementedError):
+                state = None
+            if state is not None:
+                rng = Random()
+                rng.setstate(state)
+        game._rng = make_rng(rng)
+        game.draw_pile = self.draw_pile[:]
+        game.discard_pile = self.discard_pile[:]
+        game.players = [player.copy() for player in self.players]
+        turn_order = self._turn_order
+        game._turn_order = TurnOrder(
+            game.players, turn_order.position, turn_order.direction
+        )
+        if self._winner is None:
+            game._winner = None
+        else:
+            game._winner = game.players[self.players.index(self._winner)]
+        if self._history is None:
+            game._history = None
+        else:
+            game._history = self._history[:]
+        game._log = None
+        game._hooks = None
+        return game
+
+    def undo(self):
+        """Take back the last move. Only games created with history=True
+        remember their moves."""
+        if not self._history:
+            raise ValueError('Nothing to undo')
+        self.restore(self._history.pop())
+
+    def _save(self):
+        if self._history is not None:
+            self._history.append(self.snapshot())
+
+    def _shuffle(self, cards):
+        self._rng.shuffle(cards)
+        if self._log is not None:
+            self._log.shuffle(cards)
+
+    def _check_first_card(self):
+        """Give a black first card a random colour. Otherwise only black
+        cards, or another of the same type, can be played on it."""
+        card = self.current_card
+        if card.color_id == BLACK:
+            color = self._rng.choice(COLORS)
+            if self._log is not None:
+                self._log.choice(COLORS.index(color))
+            self.discard_pile[-1] = COLORED_BLACK_CARDS[card.kind][color]
+
     def _print_winner(self):
         if self.winner.player_id:
             winner_name = self.winner.player_id
@@ -231,20 +691,46 @@ class UnoGame:
         print("Player {} wins!".format(winner_name))
         
     def _pick_up(self, player, n):
-        penalty_cards = [self.deck.pop(0) for i in range(n)]
-        player.hand.extend(penalty_cards)
+        hooks = self._hooks
+        if hooks is not None:
+            hooks.pick_up(self, player, n)
+        draw_pile = self.draw_pile
+        penalty_cards = []
+        for i in range(n):
+            if not draw_pile:
+                self._reshuffle()
+                if not draw_pile:
+                    break
+            penalty_cards.append(draw_pile.pop())
+        player.add_cards(penalty_cards)
+        if hooks is not None:
+            hooks.cards_drawn(self, player, penalty_cards)
+
+    def _reshuffle(self):
+        """Turn the discard pile, bar the current card, into a new draw
+        pile. Does nothing when every other card is in a hand."""
+        discard_pile = self.discard_pile
+        self.draw_pile.extend(CARDS[card.kind] for card in discard_pile[:-1])
+        del discard_pile[:-1]
+        if self._random:
+            self._shuffle(self.draw_pile)
+        else:
+            self.draw_pile.reverse()
+        if self._hooks is not None:
+            self._hooks.reshuffle(self)
         
 
 class AIUnoGame:
-    def __init__(self, players) -> None:
-        self.game = UnoGame(players)
-        self.player = choice(self.game.players)
+    def __init__(self, players, rng=None) -> None:
+        self.game = UnoGame(players, rng=rng)
+        self.player = self.game.rng.choice(self.game.players)
         self.player_index = self.game.players.index(self.player)
         print('The game begins. You are Player {}.'.format(self.player_index))
         self.print_hand()
         while self.game.is_active:
             print()
             next(self)
+        self.game._print_winner()
             
     def __next__(self):
         game = self.game
@@ -274,19 +760,12 @@ class AIUnoGame:
                 print('You cannot play. You must pick up a card.')
                 game.play(player_id, card=None)
                 self.print_hand()
-        elif player.can_play(game.current_card):
-            for i, card in enumerate(player.hand):
-                if game.current_card.playable(card):
-                    if card.color == 'black':
-                        new_color = choice(COLORS)
-                    else:
-                        new_color = None
-                    print("Player {} played {}".format(player, card))
-                    game.play(player=player_id, card=i, new_color=new_color)
-                    break
         else:
-            print("Player {} picked up".format(player))
-            game.play(player=player_id, card=None)
+            card, new_color = game.play_turn(first_playable)
+            if card is None:
+                print("Player {} picked up".format(player))
+            else:
+                print("Player {} played {}".format(player, card))
     
     def print_hand(self):
         print('Your hand: {}'.format(
@@ -0,0 +1,110 @@
+import pytest
+pytest.importorskip('pytest_benchmark')
+from uno import *
+from policies import first_playable
+from simulate import simulate
+
+
+def started_game(players, turns, seed=1):
+    """Return a seeded game after turns turns of first_playable."""
+    game = UnoGame(players, rng=seed)
+    for turn in range(turns):
+        game.play_turn(first_playable)
+    return game
+
+
+@pytest.mark.benchmark(group='setup')
+def test_create_deck(benchmark):
+    game = UnoGame(2, rng=1)
+    deck = benchmark(game._create_deck, True)
+    assert len(deck) == 108
+
+
+@pytest.mark.benchmark(group='setup')
+@pytest.mark.parametrize('players', [2, 7, 15])
+def test_deal(benchmark, players):
+    game = benchmark(UnoGame, players, rng=1)
+    assert len(game.players) == players
+
+
+@pytest.mark.benchmark(group='rules')
+def test_playable(benchmark):
+    def playable_all():
+        return sum(a.playable(b) for a in CARDS for b in CARDS)
+    assert benchmark(playable_all) > 0
+
+
+@pytest.mark.benchmark(group='rules')
+def test_can_play(benchmark):
+    player = started_game(4, 10).players[0]
+
+    def can_play_all():
+        return sum(player.can_play(card) for card in CARDS)
+    benchmark(can_play_all)
+
+
+@pytest.mark.benchmark(group='rules')
+def test_legal_moves(benchmark):
+    game = started_game(4, 10)
+    moves = benchmark(lambda: list(game.legal_moves()))
+    assert moves
+
+
+@pytest.mark.benchmark(group='turn')
+def test_play(benchmark):
+    base = started_game(4, 10)
+    move = next(base.legal_moves())
+    args = (
+        base.current_player.player_id, move.card,
+        'red' if move.needs_color else None
+    )
+
+    def setup():
+        return (base.clone(),) + args, {}
+
+    def play(game, player_id, card, new_color):
+        game.play(player_id, card, new_color)
+    benchmark.pedantic(play, setup=setup, rounds=2000)
+
+
+@pytest.mark.benchmark(group='turn')
+def test_play_turn(benchmark):
+    base = started_game(4, 10)
+
+    def setup():
+        return (base.clone(),), {}
+
+    def play_turn(game):
+        game.play_turn(first_playable)
+    benchmark.pedantic(play_turn, setup=setup, rounds=2000)
+
+
+@pytest.mark.benchmark(group='state')
+def test_snapshot(benchmark):
+    game = started_game(4, 30)
+    state = benchmark(game.snapshot)
+    assert state == game.snapshot()
+
+
+@pytest.mark.benchmark(group='state')
+def test_restore(benchmark):
+    game = started_game(4, 30)
+    state = game.snapshot()
+    benchmark(game.restore, state)
+    assert game.snapshot() == state
+
+
+@pytest.mark.benchmark(group='state')
+def test_clone(benchmark):
+    game = started_game(4, 30)
+    clone = benchmark(game.clone)
+    assert clone.snapshot() == game.snapshot()
+
+
+@pytest.mark.benchmark(group='game')
+@pytest.mark.parametrize('players', [2, 7, 15])
+def test_full_game(benchmark, players):
+    def play_games():
+        return simulate(players, 20, first_playable, seed=players)
+    stats = benchmark(play_games)
+    assert stats.games == 20
@@ -0,0 +1,251 @@
+"""Gym-style reinforcement learning environments for Uno.
+
+The agent plays seat 0 against opponents driven by a policy. Both
+environments follow the Gymnasium reset()/step() conventions without
+depending on it:
+
+    observation, info = env.reset()
+    observation, reward, terminated, truncated, info = env.step(action)
+
+Observations are fixed-size float32 vectors: the agent's hand as counts per
+card kind, the current card's kind and effective colour one-hot, the other
+players' hand sizes in turn order from the agent, and the direction of
+play. Actions number every card kind, with one action per colour for black
+kinds, then picking up, and info['action_mask'] marks the legal ones. The
+reward is 1 when the agent wins, -1 when another player does, and 0
+otherwise.
+
+UnoEnv plays one UnoGame. VectorUnoEnv steps a whole VectorUnoGame batch
+per call into preallocated arrays, resetting finished games automatically.
+Requires NumPy.
+"""
+import numpy as np
+from uno import UnoGame, CARDS, KINDS, BLACK, ALL_COLORS, PLAYABLE
+from constants import COLORS
+from policies import first_playable
+from simulate import MAX_TURNS, game_rng
+from vector_uno import VectorUnoGame, lowest_kind, KIND_COLOR
+
+
+N_KINDS = len(KINDS)
+N_COLORED = N_KINDS - 2
+# ACTION_KINDS[action] is the kind played, or -1 to pick up, and
+# ACTION_COLORS[action] the colour chosen for a black card
+ACTION_KINDS = np.array(
+    list(range(N_COLORED)) + [N_COLORED] * 4 + [N_COLORED + 1] * 4 + [-1],
+    np.intp
+)
+ACTION_COLORS = np.array([0] * N_COLORED + list(range(4)) * 2 + [0], np.intp)
+ACTIONS = len(ACTION_KINDS)
+PICK_UP_INDEX = ACTIONS - 1
+
+_HAND = slice(0, N_KINDS)
+_TOP = slice(N_KINDS, 2 * N_KINDS)
+_COLOR = slice(2 * N_KINDS, 2 * N_KINDS + len(ALL_COLORS))
+_SIZES = 2 * N_KINDS + len(ALL_COLORS)
+
+
+def observation_size(players):
+    return _SIZES + players - 1 + 1
+
+
+def action_mask(legal, out=None):
+    """Convert (games, kinds) legal kinds into (games, ACTIONS) masks."""
+    if out is None:
+        out = np.empty((len(legal), ACTIONS), bool)
+    out[:, :N_COLORED] = legal[:, :N_COLORED]
+    out[:, N_COLORED:N_COLORED + 4] = legal[:, N_COLORED, None]
+    out[:, N_COLORED + 4:N_COLORED + 8] = legal[:, N_COLORED + 1, None]
+    out[:, PICK_UP_INDEX] = ~legal.any(1)
+    return out
+
+
+class UnoEnv:
+    """A single game of players players, the agent in seat 0 and every
+    other seat played by opponent, a policy from policies.py."""
+    def __init__(self, players=4, opponent=first_playable, seed=None,
+                 max_turns=MAX_TURNS) -> None:
+        self.players = players
+        self.opponent = opponent
+        self.seed = seed
+        self.max_turns = max_turns
+        self.games = 0
+        self.game = None
+        self.turns = 0
+        self._observation = np.zeros(observation_size(players), np.float32)
+        self._mask = np.zeros(ACTIONS, bool)
+
+    def __repr__(self) -> str:
+        return '<UnoEnv object: {} players>'.format(self.players)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+            self.games = 0
+        self.game = UnoGame(
+            self.players, rng=game_rng(self.seed, self.games)
+        )
+        self.games += 1
+        self.turns = 0
+        return self._observe(), self._info()
+
+    def step(self, action):
+        game = self.game
+        if game is None or not game.is_active:
+            raise ValueError('Game is over: call reset()')
+        if not self._mask[action]:
+            raise ValueError('Invalid action: {} is not legal'.format(action))
+        kind = ACTION_KINDS[action]
+        agent = game.players[0]
+        if kind < 0:
+            game.play(0, card=None)
+        else:
+            card = agent.hand.index(CARDS[kind])
+            if KIND_COLOR[kind] == BLACK:
+                game.play(0, card, COLORS[ACTION_COLORS[action]])
+            else:
+                game.play(0, card)
+        self.turns += 1
+        while (
+            game.is_active and game.current_player is not agent and
+            self.turns < self.max_turns
+        ):
+            game.play_turn(self.opponent)
+            self.turns += 1
+
+        if game.winner is None:
+            reward = 0.0
+        elif game.winner is agent:
+            reward = 1.0
+        else:
+            reward = -1.0
+        terminated = not game.is_active
+        truncated = not terminated and self.turns >= self.max_turns
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def action_mask(self):
+        return self._mask.copy()
+
+    def _observe(self):
+        game = self.game
+        agent = game.players[0]
+        observation = self._observation
+        observation[:] = 0
+        observation[_HAND] = agent.kind_counts
+        top = game.current_card
+        observation[N_KINDS + top.kind] = 1
+        observation[_COLOR.start + top._color_id] = 1
+        for i in range(1, self.players):
+            observation[_SIZES + i - 1] = len(
+                game.players[i * game.direction % self.players].hand
+            )
+        observation[-1] = game.direction
+
+        mask = self._mask
+        mask[:] = False
+        legal = PLAYABLE[top.state] & agent.hand_mask
+        if not legal:
+            mask[PICK_UP_INDEX] = True
+        while legal:
+            kind = (legal & -legal).bit_length() - 1
+            legal &= legal - 1
+            if kind < N_COLORED:
+                mask[kind] = True
+            else:
+                start = N_COLORED + 4 * (kind - N_COLORED)
+                mask[start:start + 4] = True
+        return observation.copy()
+
+    def _info(self):
+        return {'action_mask': self._mask.copy()}
+
+
+class VectorUnoEnv:
+    """num_envs games stepped together, the agent in seat 0 of each and the
+    other seats played by opponent, a vector_uno policy. Observations,
+    rewards and masks are written into arrays that are reused by every
+    call; copy them to keep them. A game that ends is reset in the same
+    step, so the observation returned for it is the start of a new game."""
+    def __init__(self, num_envs, players=4, opponent=lowest_kind, seed=None,
+                 max_turns=MAX_TURNS, fast_shuffle=True) -> None:
+        self.num_envs = num_envs
+        self.fast_shuffle = fast_shuffle
+        self.players = players
+        self.opponent = opponent
+        self.seed = seed
+        self.max_turns = max_turns
+        self.game = None
+        self._rows = np.arange(num_envs)
+        self._observations = np.zeros(
+            (num_envs, observation_size(players)), np.float32
+        )
+        self._masks = np.zeros((num_envs, ACTIONS), bool)
+        self._rewards = np.zeros(num_envs, np.float32)
+        self._terminated = np.zeros(num_envs, bool)
+        self._truncated = np.zeros(num_envs, bool)
+        self._info = {'action_mask': self._masks}
+
+    def __repr__(self) -> str:
+        return '<VectorUnoEnv object: {} games of {} players>'.format(
+            self.num_envs, self.players
+        )
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        self.game = VectorUnoGame(
+            self.num_envs, self.players, self.seed, self.fast_shuffle
+        )
+        self._observe()
+        return self._observations, self._info
+
+    def step(self, actions):
+        game = self.game
+        if game is None:
+            raise ValueError('Game is over: call reset()')
+        actions = np.asarray(actions, np.intp)
+        if not self._masks[self._rows, actions].all():
+            raise ValueError('Invalid action: not legal in every game')
+        kinds = ACTION_KINDS[actions]
+        colors = ACTION_COLORS[actions]
+        game.step(lambda game, index, legal: (kinds, colors), self._rows)
+
+        # play the opponents until it is the agent's turn in every game
+        while True:
+            waiting = np.flatnonzero(
+                (game.winner < 0) & (game.current != 0) &
+                (game.turns < self.max_turns)
+            )
+            if not waiting.size:
+                break
+            game.step(self.opponent, waiting)
+
+        rewards = self._rewards
+        rewards[:] = 0
+        rewards[game.winner == 0] = 1
+        rewards[game.winner > 0] = -1
+        np.greater_equal(game.winner, 0, out=self._terminated)
+        np.greater_equal(game.turns, self.max_turns, out=self._truncated)
+        self._truncated &= ~self._terminated
+        done = np.flatnonzero(self._terminated | self._truncated)
+        if done.size:
+            game.reset(done)
+        self._observe()
+        return (
+            self._observations, rewards, self._terminated, self._truncated,
+            self._info
+        )
+
+    def _observe(self):
+        game = self.game
+        rows = self._rows
+        observations = self._observations
+        observations[:] = 0
+        observations[:, _HAND] = game.hands[:, 0]
+        observations[rows, N_KINDS + game.current_card] = 1
+        observations[rows, _COLOR.start + game.color] = 1
+        for i in range(1, self.players):
+            seats = i * game.direction % self.players
+            observations[:, _SIZES + i - 1] = game.hand_sizes[rows, seats]
+        observations[:, -1] = game.direction
+        action_mask(game.legal(rows), self._masks)
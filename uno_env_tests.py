@@ -0,0 +1,99 @@
+import pytest
+np = pytest.importorskip('numpy')
+from uno import CARDS, PLAYABLE
+from vector_uno import VectorUnoGame
+from uno_env import *
+
+
+env = UnoEnv(4, seed=3)
+observation, info = env.reset()
+mask = info['action_mask']
+assert observation.shape == (observation_size(4),)
+assert mask.shape == (ACTIONS,)
+game = env.game
+agent = game.players[0]
+assert observation[:len(CARDS)].sum() == 7
+assert observation[len(CARDS) + game.current_card.kind] == 1
+assert observation[-1] == 1
+assert list(observation[-4:-1]) == [7, 7, 7]
+legal = PLAYABLE[game.current_card.state] & agent.hand_mask
+assert mask[PICK_UP_INDEX] == (not legal)
+
+with pytest.raises(ValueError):
+    env.step(int(np.flatnonzero(~mask)[0]))
+
+rewards = []
+for episode in range(20):
+    observation, info = env.reset()
+    while True:
+        action = int(np.flatnonzero(info['action_mask'])[0])
+        observation, reward, terminated, truncated, info = env.step(action)
+        assert env.game.current_player is env.game.players[0] or terminated
+        if terminated or truncated:
+            break
+        assert reward == 0
+    assert terminated
+    assert reward == (1 if env.game.winner is env.game.players[0] else -1)
+    rewards.append(reward)
+assert set(rewards) == {-1, 1}
+
+with pytest.raises(ValueError):
+    env.step(PICK_UP_INDEX)
+
+# the same seed replays the same games
+first = UnoEnv(3, seed=5)
+second = UnoEnv(3, seed=5)
+a, _ = first.reset()
+b, _ = second.reset()
+assert (a == b).all()
+
+
+legal = np.zeros((2, len(CARDS)), bool)
+legal[0, [3, 52]] = True
+masks = action_mask(legal)
+assert list(np.flatnonzero(masks[0])) == [3] + list(range(52, 56))
+assert list(np.flatnonzero(masks[1])) == [PICK_UP_INDEX]
+assert (ACTION_KINDS[52:56] == 52).all()
+assert (ACTION_KINDS[56:60] == 53).all()
+assert ACTION_KINDS[PICK_UP_INDEX] == -1
+
+
+for fast_shuffle in (False, True):
+    venv = VectorUnoEnv(64, 3, seed=2, max_turns=200,
+                        fast_shuffle=fast_shuffle)
+    observations, info = venv.reset()
+    assert observations.shape == (64, observation_size(3))
+    assert info['action_mask'].shape == (64, ACTIONS)
+    assert (observations[:, :len(CARDS)].sum(1) == 7).all()
+    finished = 0
+    total = 0
+    for turn in range(300):
+        masks = info['action_mask']
+        assert (masks.sum(1) > 0).all()
+        assert (venv.game.current == 0).all()
+        actions = masks.argmax(1)
+        observations, rewards, terminated, truncated, info = venv.step(actions)
+        assert not (terminated & truncated).any()
+        assert (rewards[~terminated] == 0).all()
+        assert (np.abs(rewards[terminated]) == 1).all()
+        finished += terminated.sum() + truncated.sum()
+        total += rewards.sum()
+        hands = venv.game.hands
+        assert (observations[:, :len(CARDS)] == hands[:, 0]).all()
+        assert (venv.game.hand_sizes == hands.sum(2)).all()
+        assert (
+            hands.sum((1, 2)) + venv.game.draw_size + venv.game.discard_size
+            == 108
+        ).all()
+    # finished games were dealt again in the same step
+    assert finished > 64
+    assert venv.game.dealt == 64 + finished
+    assert (venv.game.winner < 0).all()
+
+    bad = info['action_mask'].argmin(1)
+    with pytest.raises(ValueError):
+        venv.step(bad)
+
+game = VectorUnoGame(8, 4, seed=1, fast_shuffle=True)
+game.run()
+assert game.stats().unfinished == 0
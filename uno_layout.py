@@ -0,0 +1,84 @@
+"""Where the pygame zero game draws everything, and what is under a click.
+
+Plain arithmetic on the window's coordinates, without pgzero, so that
+uno_pgz.py can hit-test clicks without asking each sprite and the layout
+can be tested on its own.
+"""
+from collections import namedtuple
+
+
+WIDTH = 1200
+HEIGHT = 800
+
+# the size of the card images, the x of the middle of the first card in a
+# hand and the most there is between one card's and the next's
+CARD_WIDTH, CARD_HEIGHT = 72, 108
+HAND_LEFT = 130
+CARD_STEP = 80
+
+# the y of the middle of the first hand, the most there is between one
+# hand's and the next's, and the y the last hand must end above, clear of
+# the log
+HANDS_TOP = 330
+ROW_STEP = 130
+HANDS_BOTTOM = HEIGHT - 80
+
+
+def row_step(players):
+    """Return the distance between the hands of players players, squeezed
+    for them all to fit above HANDS_BOTTOM."""
+    if players < 2:
+        return ROW_STEP
+    fits = (HANDS_BOTTOM - CARD_HEIGHT // 2 - HANDS_TOP) // (players - 1)
+    return min(ROW_STEP, fits)
+
+
+# the middles of the draw pile, the current card and the first colour
+DECK_POS = (130, 70)
+TOP_POS = (210, 70)
+COLOR_POS = (290, 70)
+
+
+def over(pos, centre):
+    """Return whether pos is on the card sized image centred at centre."""
+    return (
+        abs(pos[0] - centre[0]) <= CARD_WIDTH / 2
+        and abs(pos[1] - centre[1]) <= CARD_HEIGHT / 2
+    )
+
+
+def color_pos(i):
+    return (COLOR_POS[0] + i * CARD_STEP, COLOR_POS[1])
+
+
+class HandLayout(namedtuple('HandLayout', ['x', 'y', 'step', 'count'])):
+    """Where a hand of count cards is drawn: card c with its middle at
+    (x + c * step, y). A hand too long for the window is squeezed in, each
+    card overlapping the one before."""
+    __slots__ = ()
+
+    @classmethod
+    def for_hand(cls, count, y):
+        step = CARD_STEP
+        if count > 1:
+            fits = (WIDTH - HAND_LEFT - CARD_WIDTH) // (count - 1)
+            step = max(1, min(step, fits))
+        return cls(HAND_LEFT, y, step, count)
+
+    def pos(self, c):
+        return (self.x + c * self.step, self.y)
+
+    def card_at(self, pos):
+        """Return the index of the card drawn at pos, the one on top where
+        cards overlap, or None if there is none."""
+        px, py = pos
+        if not self.count or abs(py - self.y) > CARD_HEIGHT / 2:
+            return None
+        offset = px - (self.x - CARD_WIDTH / 2)
+        if offset < 0:
+            return None
+        c = min(int(offset // self.step), self.count - 1)
+        # in the gap after card c, or past the last card
+        if offset - c * self.step > CARD_WIDTH:
+            return None
+        return c
@@ -0,0 +1,49 @@
+from uno_layout import *
+
+
+def card_under(hand, pos):
+    """The card at pos found the slow way: the last drawn whose image
+    covers it."""
+    found = None
+    for c in range(hand.count):
+        if over(pos, hand.pos(c)):
+            found = c
+    return found
+
+
+# hands of every size fit in the window, and a click resolves to the card
+# on top under it, or to none in the gaps between cards
+for count in range(41):
+    hand = HandLayout.for_hand(count, 460)
+    assert hand.step <= CARD_STEP
+    if count:
+        assert hand.pos(0)[0] == HAND_LEFT
+        assert hand.pos(count - 1)[0] + CARD_WIDTH / 2 <= WIDTH
+    for x in range(0, WIDTH + 50, 3):
+        for y in (350, 405, 406, 460, 514, 515, 600):
+            assert hand.card_at((x, y)) == card_under(hand, (x, y)), (
+                count, x, y
+            )
+
+# spaced out, the gap after a card is no card's
+hand = HandLayout.for_hand(3, 460)
+assert hand.step == CARD_STEP > CARD_WIDTH
+assert hand.card_at(hand.pos(1)) == 1
+assert hand.card_at((HAND_LEFT + CARD_WIDTH / 2 + 1, 460)) is None
+# squeezed, the visible edge of each card is that card's
+hand = HandLayout.for_hand(30, 460)
+assert hand.step < CARD_WIDTH
+assert hand.card_at((hand.pos(10)[0] - CARD_WIDTH / 2, 460)) == 10
+assert hand.card_at(hand.pos(29)) == 29
+
+# every player's row ends above the log
+for players in range(2, 16):
+    step = row_step(players)
+    assert 0 < step <= ROW_STEP
+    assert HANDS_TOP + (players - 1) * step + CARD_HEIGHT / 2 <= HANDS_BOTTOM
+assert row_step(3) == ROW_STEP
+
+assert over(DECK_POS, DECK_POS)
+assert not over((DECK_POS[0] + CARD_WIDTH, DECK_POS[1]), DECK_POS)
+assert color_pos(0) == COLOR_POS
+assert not over(color_pos(0), color_pos(1))
@@ -1,455 +1,386 @@
+"""Uno against the bots in a pygame zero window.
+
+Run ``pgzrun uno_pgz.py``, or ``python uno_pgz.py --players 4`` to choose
+the number of players. Importing this module only defines things: the game
+is dealt and its thread started by the first update() once the window is
+open, and each card face is loaded when first shown.
+"""
+import argparse
 import pgzrun
-from random import shuffle, choice
-from itertools import product, repeat, chain
+import sched
+from collections import namedtuple
+from queue import Queue
 from threading import Thread
-from time import sleep
-from constants import COLORS, ALL_COLORS, NUMBERS, SPECIAL_CARD_TYPES
-from constants import COLOR_CARD_TYPES, BLACK_CARD_TYPES, CARD_TYPES
+from time import monotonic, perf_counter, sleep
+from constants import COLORS
 from pgzero.actor import Actor
+from uno import UnoGame, CARDS, KINDS
+from policies import first_playable
+# pgzero sizes the window by this module's WIDTH and HEIGHT
+from uno_layout import WIDTH, HEIGHT, HANDS_TOP, DECK_POS, TOP_POS
+from uno_layout import HandLayout, row_step, over, color_pos
 
 
-class UnoCard:
-    def __init__(self, color, card_type) -> None:
-        self._validate(color, card_type)
-        self._color = color
-        self.card_type = card_type
-        self.temp_color = None
-        self.sprite = Actor('{}_{}'.format(color, card_type))
-        
-    def __repr__(self) -> str:
-        return'<UnoCard object: {} {}>'.format(self.color, self.card_type)
-    
-    def __str__(self) -> str:
-        return '{} {}'.format(self.color_short, self.card_type_short)
-    
-    def __format__(self, f) -> str:
-        if f == 'full':
-            return'{}{}'.format(self.color, self.card_type)
-        else:
-            return str(self)
-        
-    def __eq__(self, other) -> bool:
-        return self.color == other.color and self.card_type == other.card_type
-    
-    def _validate(self, color, card_type):
-        if color not in ALL_COLORS:
-            raise ValueError('Invalid color')
-        if color == 'black' and card_type not in BLACK_CARD_TYPES:
-            raise ValueError('Invalid card type')
-        if color != 'black' and card_type not in COLOR_CARD_TYPES:
-            raise ValueError('Invalid card type')
-        
+# the image of each card kind, as numbered in uno.KINDS
+CARD_IMAGES = tuple(
+    '{}_{}'.format(color, card_type) for color, card_type in KINDS
+)
 
-    @property
-    def color(self):
-        return self.temp_color if self.temp_color else self._color
-    
-    @color.setter
-    def color(self, value):
-        self._color = value
-    
-    @property
-    def color_short(self):
-        return self.color[0].upper()
-    
-    @property
-    def card_type_short(self):
-        if self.card_type in ('skip', 'reverse', 'wildcard'):
-            return self.card_type[0].upper()
-        else:
-            return self.card_type
-        
-    
-    @property
-    def temp_color(self):
-        return self._temp_color
-    
-    @temp_color.setter
-    def temp_color(self, color):
-        if color is not None:
-            if color not in COLORS:
-                raise ValueError('Invalid color')
-        self._temp_color = color
-        
-    def playable(self, other):
-        return (
-            self._color == other.color or
-            self.card_type == other.card_type or
-            other.color == 'black'
-        )
-        
 
-class UnoPlayer:
-    def __init__(self, cards, player_id=None) -> None:
-        if len(cards) !=7:
-            raise ValueError(
-                'Invalid player: must be initalised with 7 UnoCards'
-            )
-        if not all(isinstance(card, UnoCard) for card in cards):
-            raise ValueError(
-                'Invalid player: cards must all be UnoCard object'
-            )
-        self.hand = cards
-        self.player_id = player_id
-        
-    def __repr__(self) -> str:
-        if self.player_id is not None:
-            return '<UnoPlayer object: player {}>'.format(self.player_id)
-        else:
-            return '<UnoPlayer object>'
-        
-    def __str__(self) -> str:
-        if self.player_id is not None:
-            return str(self.player_id)
-        else:
-            return repr(self)
-    
-    def can_play(self, current_card):
-        return any(current_card.playable(card) for card in self.hand)
-    
-
-class ReversibleCycle:
-    def __init__(self, iterable) -> None:
-        self._item = list(iterable)
-        self._pos = None
-        self._reverse = False
-        
-    def __next__(self):
-        if self.pos is None:
-            self.pos = 0 if not self._reverse else -1
-        else:
-            self.pos = (self.pos + self._delta) % len(self._item)
-        return self._item[self.pos]
-    
-    @property
-    def _delta(self):
-        return -1 if self._reverse else 1
-    
-    @property
-    def pos(self):
-        return self._pos
-    
-    @pos.setter
-    def pos(self, value):
-        self._pos = value % len(self._item)
-
-    def reverse(self):
-        self._reverse = not self._reverse
-    
-
-class UnoGame:
-    def __init__(self, players, random=True) -> None:
-        if not isinstance(players, int):
-            raise ValueError('Invalid game: players must be integer')
-        if not 2 <= players <= 15:
-            raise ValueError('Invalid game: must be between 2 and 15 players')
-        self.deck = self._create_deck(random=random)
-        self.players = [
-            UnoPlayer(self._deal_hand(), n) for n in range(players)
-        ]
-        self._player_cycle = ReversibleCycle(self.players)
-        self._current_player = next(self._player_cycle)
-        self._winner = None
-        self._check_first_card()
-        
-    def __next__(self):
-        self._current_player = next(self._player_cycle)
-        
-    def _create_deck(self, random):
-        color_cards = product(COLORS, COLOR_CARD_TYPES)
-        black_cards = product(repeat('black', 4), BLACK_CARD_TYPES)
-        all_cards = chain(color_cards, black_cards)
-        deck = [UnoCard(color, card_type) for color, card_type in all_cards]
-        if random:
-            shuffle(deck)
-            return deck
-        else:
-            return list(reversed(deck))
-        
-    def _deal_hand(self):
-        return [self.deck.pop() for i in range(7)]
-    
-    @property
-    def current_card(self):
-        return self.deck[-1]
-    
-    @property
-    def is_active(self):
-        return all(len(player.hand) > 0 for player in self.players) #burda player idi
-    
-    @property
-    def current_player(self):
-        return self._current_player
-    
-    @property
-    def winner(self):
-        return self._winner
-    
-    def play(self, player, card=None, new_color=None):
-        if not isinstance(player, int):
-            raise ValueError('Invalid player: should be the index number')
-        if not 0 <= player < len(self.players):
-            raise ValueError('Invalid player: index out of range')
-        _player = self.players[player]
-        if self.current_player != _player:
-            raise ValueError('Invalid player: not their turn')
-        if card is None:
-            self._pick_up(_player, 1)
-            next(self)
-            return
-        _card = _player.hand[card]
-        if not self.current_card.playable(_card):
-            raise ValueError(
-                'Invalid card: {} not playable on {}'.format(
-                    _card, self.current_card
-                )
-            )
-        if _card.color == 'black':
-            if new_color not in COLORS:
-                raise ValueError(
-                    'Invalid new_color: must be red, yellow, green or blue'
-                )
-        if not self.is_active:
-            raise ValueError('GAME OVER')
-        
-        player_card = _player.hand.pop(card)
-        self.deck.append(player_card)
-        
-        card_color = player_card.color
-        card_type = player_card.card_type
-        if card_color == 'black':
-            self.current_card.temp_color = new_color
-            if card_type == '+4':
-                next(self)
-                self._pick_up(self.current_player, 4)
-        elif card_type == 'reverse':
-            self._player_cycle.reverse()
-        elif card_type == 'skip':
-            next(self)
-        elif card_type == '+2':
-            next(self)
-            self._pick_up(self.current_player, 2)
-            
-        if self.is_active:
-            next(self)
-        else:
-            self._winner =_player
-            self._print_winner()
-    
-    def _print_winner(self):
-        if self.winner.player_id:
-            winner_name = self.winner.player_id
-        else:
-            winner_name = self.players.index(self.winner)
-        print("Player {} wins!".format(winner_name))
-        
-    def _pick_up(self, player, n):
-        penalty_cards = [self.deck.pop(0) for i in range(n)]
-        player.hand.extend(penalty_cards)
-        
-    def _check_first_card(self):
-        if self.current_card.color == 'black':
-            color = choice(COLORS)
-            self.current_card.temp_color = color
-            print("Selected random color for black card: {}".format(color))
+class SpriteCache(dict):
+    """One Actor per image, loaded the first time it is asked for and
+    shared by every card with that face. An Actor is moved to each place
+    it is drawn, so hit tests use the layout rather than its pos."""
+    def __missing__(self, image):
+        actor = self[image] = Actor(image)
+        return actor
+
+
+sprites = SpriteCache()
+
+# every image the view shows, for it to load while the window is idle
+IMAGES = CARD_IMAGES + ('back',) + tuple(COLORS)
+
+
+# the events on_mouse_down queues for the human player's turn, each sent
+# as (turn, event, value): the turn of the Frame clicked on, then the index
+# of a card in their hand, None, or a colour
+CARD, PICK_UP, COLOR = 'card', 'pick_up', 'color'
+
+# What the screen shows of a game, published whole by the game loop's thread
+# after every change, so the screen never sees a move half made. hands are
+# the kinds of each player's cards, player, current and winner are player
+# indexes, top is the kind of the current card and color its chosen colour.
+# turn counts the turns played, so a click can be told from one made on an
+# earlier turn's frame.
+Frame = namedtuple('Frame', [
+    'turn', 'hands', 'player', 'current', 'winner', 'top', 'color', 'log',
+    'color_selected_required',
+])
+
+# seconds between a turn ending and a bot playing the next
+BOT_DELAY = 1.0
 
 
 class GameData:
+    """What the screen shares with the game loop's thread: the clicks of the
+    human player, queued for the thread to wait on, and the last Frame it
+    published for the screen."""
     def __init__(self) -> None:
-        self.selected_card = None
-        self.selected_color = None
-        self.color_selected_required = False
-        self.log = ''
-        
-    @property
-    def currect_card(self):
-        if not self.deck:
-            return None
-        return self.deck[-1]
-    
-    @property
-    def selected_card(self):
-        selected_card = self._selected_card
-        self.selected_card = None
-        return selected_card
-    
-    @selected_card.setter
-    def selected_card(self,value):
-        self._selected_card = value
-        
-    @property
-    def selected_color(self):
-        selected_color = self._selected_color
-        self.selected_color = None
-        return selected_color
-    
-    @selected_color.setter
-    def selected_color(self, value):
-        self._selected_color = value
-        
-        
+        self.inputs = Queue()
+        self.frame = None
+
+
 game_data = GameData()
 
-    
+
 class AIUnoGame:
-    def __init__(self, players) -> None:
-        self.game = UnoGame(players)
-        self.player = choice(self.game.players)
+    """The rules are uno.UnoGame's: this only takes the human player's
+    moves from game_data and plays the bots' turns."""
+    def __init__(self, players, rng=None, hooks=None) -> None:
+        self.game = UnoGame(
+            players, rng=rng, hooks=hooks, color_first_card=True
+        )
+        self.player = self.game.rng.choice(self.game.players)
         self.player_index = self.game.players.index(self.player)
+        self.turn = 0
+        self.log = ''
+        self.color_selected_required = False
         print('The game begins. You are Player {}'.format(self.player_index))
-        
+        current_card = self.game.current_card
+        if current_card.temp_color is not None:
+            self.log = 'Selected random color for black card: {}'.format(
+                current_card.temp_color
+            )
+        self.publish()
+
+    def publish(self, log=None):
+        """Show log, if given, and the game as it is now. Only the game
+        loop's thread may call this once it has started."""
+        if log is not None:
+            self.log = log
+        game = self.game
+        players = game.players
+        winner = game.winner
+        current_card = game.current_card
+        # one assignment, so the screen has either the last frame or this
+        game_data.frame = Frame(
+            self.turn,
+            tuple(
+                tuple(card.kind for card in player.hand) for player in players
+            ),
+            self.player_index,
+            players.index(game.current_player),
+            None if winner is None else players.index(winner),
+            current_card.kind,
+            current_card.temp_color,
+            self.log,
+            self.color_selected_required,
+        )
+
     def __next__(self):
         game = self.game
         player = game.current_player
-        player_id = player.player_id
-        current_card = game.current_card
-        
-        if current_card is not None:
-            current_card.sprite.pos = (210, 70)
-            # current_card.sprite.draw()
-        else:
-            print("No current card avaliable (deck might be empty).")
-            
         if player == self.player:
-            player = False
-            while not player:
-                card_index = None
-                while card_index is None:
-                    card_index = game_data.selected_card
-                new_color = None
-                if card_index is not False:
-                    card = player.hand[card_index]
-                    if not game.current_card.playable(card):
-                        game_data.log = 'You cannot play that card'
-                        continue
-                    else:
-                        game_data.log = 'You played card {:full}'.format(card)
-                        if card.color == 'black' and len(player.hand) > 1:
-                            game_data.color_selected_required = True
-                            while new_color is not None: 
-                                new_color = game_data.selected_color
-                            game_data.log = 'You selected {}'.format(new_color)
-            else:
-                card_index = None
-                game_data.log = 'You picked up'
-            game.play(player_id, card_index, new_color)
-            player = True
-        elif player.can_play(game.current_card):
-            for i, card in enumerate(player.hand):
-                if game.current_card.playable(card):
-                    if card.color == 'black':
-                        new_color = choice(COLORS)
-                    else:
-                        new_color = None
-                    game_data.log = "Player {} played {:full}".format(player, card)
-                    game.play(player=player_id, card=i, new_color=new_color)
-                    break
+            log = self.human_turn()
         else:
-            game_data.log = "Player {} picked up".format(player)
-            game.play(player=player_id, card=None)
-            
-            
+            card, new_color = game.play_turn(first_playable)
+            if card is None:
+                log = "Player {} picked up".format(player)
+            else:
+                log = "Player {} played {:full}".format(player, card)
+        self.turn += 1
+        self.publish(log)
+
+    def human_turn(self):
+        """Play the human player's turn from their clicks, blocking on
+        game_data.inputs until one plays a card or picks up, and return
+        what to log. A black card is held until a colour is clicked.
+        Clicks on an earlier turn's frame are ignored."""
+        game = self.game
+        player_id = self.player.player_id
+        hand = self.player.hand
+        inputs = game_data.inputs
+        black_card = None
+        while True:
+            turn, event, value = inputs.get()
+            if turn != self.turn:
+                continue
+            if black_card is not None:
+                if event != COLOR:
+                    continue
+                self.color_selected_required = False
+                game.play(player_id, black_card, value)
+                return 'You selected {}'.format(value)
+            if event == PICK_UP:
+                game.play(player_id, None)
+                return 'You picked up'
+            if event != CARD or not 0 <= value < len(hand):
+                continue
+            card = hand[value]
+            if not game.current_card.playable(card):
+                self.publish('You cannot play that card')
+                continue
+            if card.color == 'black':
+                black_card = value
+                self.color_selected_required = True
+                self.publish('You played card {:full}'.format(card))
+            else:
+                game.play(player_id, value)
+                return 'You played card {:full}'.format(card)
+
     def print_hand(self):
         print('Your hand: {}'.format(
             ' '.join(str(card) for card in self.player.hand)
         ))
-        
-        
-# num_players = 3
-# game = AIUnoGame(num_players)
+
 
 def game_loop(self):
+    """Play self's game to its end on a timer: each bot's turn is scheduled
+    BOT_DELAY seconds after the turn before it, and the human player's at
+    once, to wait for their clicks. Neither waiting polls."""
     if not isinstance(self, AIUnoGame):
         raise TypeError("Expected an AIUnoGame instance!")
-    while self.game.is_active:
-        sleep(1)
+    scheduler = sched.scheduler(monotonic, sleep)
+
+    def schedule_turn():
+        delay = 0 if self.game.current_player == self.player else BOT_DELAY
+        scheduler.enter(delay, 0, play_turn)
+
+    def play_turn():
         next(self)
+        if self.game.is_active:
+            schedule_turn()
 
+    schedule_turn()
+    scheduler.run()
 
-num_players = 3
-game = AIUnoGame(num_players)
-game_loop_thread = Thread(target=game_loop, args=(game,))
-game_loop_thread.start()
-
-WIDTH = 1200
-HEIGHT = 800
-
-deck_img = Actor('back')
-color_imgs = {color: Actor(color) for color in COLORS}
-
-try:
-    sprite = Actor('back')
-except Exception as e:
-    print(f"Error loading sprite: {e}")
-
-
-def draw_deck():
-    deck_img.pos = (130, 70)
-    if deck_img:
-        deck_img.draw()
-    else:
-        print("Error: deck image is None!")
-    
-    current_card = game.game.current_card
-    if current_card.sprite is not None:
-        current_card.sprite.pos = (210, 70)
-        current_card.sprite.draw()
-    else:
-        print("Error: current card sprite is None!")
-        
-    if game_data.color_selected_required:
-        for i, card in enumerate(color_imgs.values()):
-            if card:
-                card.pos = (290 + i * 80, 70)
-                card.draw()
+
+# Where a player's row is drawn: their name text at pos, in fontsize and
+# color, and their hand laid out by hand, images being the image of each card.
+RowLayout = namedtuple('RowLayout', [
+    'text', 'pos', 'fontsize', 'color', 'hand', 'images',
+])
+
+
+class GameView:
+    """Everything drawn on screen. The UnoCards of the rules know nothing of
+    sprites: the view draws each face with its shared Actor from sprites,
+    at places laid out again only when the hands change.
+
+    The view never reads the game itself, which the game loop's thread is
+    changing, only the Frames it publishes. update() takes the newest one
+    as self.frame, which is what is drawn and clicked on until the next,
+    and draw() repaints the screen only after a new one: the display keeps
+    the last frame, so the frames between moves cost nothing to draw. Those
+    idle frames load the images not shown yet, one each."""
+    def __init__(self) -> None:
+        self.frame = game_data.frame
+        self._unloaded = list(IMAGES)
+        self._layout = None
+        self._layout_hands = None
+        self.dirty = True
+
+    @property
+    def layout(self):
+        """Return a RowLayout per player of self.frame."""
+        frame = self.frame
+        key = (frame.hands, frame.current, frame.winner)
+        if self._layout_hands != key:
+            self._layout = self._lay_out(frame)
+            self._layout_hands = key
+        return self._layout
+
+    def _lay_out(self, frame):
+        layout = []
+        step = row_step(len(frame.hands))
+        # the name of each player fills the height of their row
+        fontsize = min(100, step)
+        for p, hand in enumerate(frame.hands):
+            color = 'red' if p == frame.current else 'black'
+            text = 'P{} {}'.format(p, 'wins' if frame.winner == p else '')
+            if p == frame.player:
+                images = [CARD_IMAGES[kind] for kind in hand]
             else:
-                print(f"Error: color card {i} is None!")
-    elif current_card.color == 'black' and current_card.temp_color is not None:
-        color_img = color_imgs[current_card.temp_color]
-        if color_img:
-            color_img.pos = (290, 70)
-            color_img.draw()
+                images = ['back'] * len(hand)
+            y = HANDS_TOP + p * step
+            layout.append(RowLayout(
+                text, (0, y - 3 * fontsize // 10), fontsize, color,
+                HandLayout.for_hand(len(hand), y), images
+            ))
+        return layout
+
+    def draw_deck(self):
+        sprite = sprites['back']
+        sprite.pos = DECK_POS
+        sprite.draw()
+
+        frame = self.frame
+        sprite = sprites[CARD_IMAGES[frame.top]]
+        sprite.pos = TOP_POS
+        sprite.draw()
+
+        if frame.color_selected_required:
+            colors = COLORS
+        elif frame.color is not None:
+            colors = (frame.color,)
         else:
-            print("Error: color image not found for black card color!")
-        
-def draw_players_hands():
-    for p, player in enumerate(game.game.players):
-        color = 'red' if player == game.game.current_player else 'black'
-        text = 'P{} {}'.format(p, 'wins' if game.game.winner == player else '')
-        pgzrun.screen.draw.text(text, (0, 300 + p * 130), fontsize=100, color=color)
-        for c, card in enumerate(player.hand):
-            if player == game.player:
-                sprite = card.sprite
-            else:
-                sprite = Actor('back')
-            sprite.pos = (130 + c * 80, 330 + p * 130)
+            colors = ()
+        for i, color in enumerate(colors):
+            sprite = sprites[color]
+            sprite.pos = color_pos(i)
             sprite.draw()
-    
-def show_log():
-    pgzrun.screen.draw.text(game_data.log, midbottom=(WIDTH/2, HEIGHT-50), color='black')
-        
+
+    def draw_players_hands(self):
+        layout = self.layout
+        player = self.frame.player
+        # rows squeezed together overlap, so the human player's, the only
+        # one clicked on, is drawn last, on top
+        for row in layout[:player] + layout[player + 1:] + [layout[player]]:
+            pgzrun.screen.draw.text(
+                row.text, row.pos, fontsize=row.fontsize, color=row.color
+            )
+            for c, image in enumerate(row.images):
+                sprite = sprites[image]
+                sprite.pos = row.hand.pos(c)
+                sprite.draw()
+
+    def show_log(self):
+        pgzrun.screen.draw.text(
+            self.frame.log, midbottom=(WIDTH/2, HEIGHT-50), color='black'
+        )
+
+    def update(self):
+        """Take the last Frame published, marking the screen dirty if it is
+        a new one."""
+        frame = game_data.frame
+        if frame is not self.frame:
+            self.frame = frame
+            self.dirty = True
+        elif self._unloaded:
+            sprites[self._unloaded.pop()]
+
+    def draw(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+        pgzrun.screen.clear()
+        pgzrun.screen.fill((255, 255, 255))
+        self.draw_deck()
+        self.draw_players_hands()
+        self.show_log()
+
+    def on_mouse_down(self, pos):
+        frame = self.frame
+        if frame.current == frame.player and frame.winner is None:
+            i = self.layout[frame.player].hand.card_at(pos)
+            if i is not None:
+                game_data.inputs.put((frame.turn, CARD, i))
+                print('Selected card {} index {}'.format(
+                    CARDS[frame.hands[frame.player][i]], i
+                ))
+            if over(pos, DECK_POS):
+                game_data.inputs.put((frame.turn, PICK_UP, None))
+                print('Selected pick up')
+            if frame.color_selected_required:
+                for i, color in enumerate(COLORS):
+                    if over(pos, color_pos(i)):
+                        game_data.inputs.put((frame.turn, COLOR, color))
+
+
+num_players = 3
+seed = None
+game = view = game_loop_thread = None
+loaded = perf_counter()
+
+
+def start():
+    """Deal a game of num_players players and start its thread."""
+    global game, view, game_loop_thread
+    game = AIUnoGame(num_players, rng=seed)
+    view = GameView()
+    # a daemon, so closing the window does not wait on the human player's
+    # turn
+    game_loop_thread = Thread(target=game_loop, args=(game,), daemon=True)
+    game_loop_thread.start()
+
+
 def update():
-    pgzrun.screen.clear()
-    pgzrun.screen.fill((255, 255, 255))
-    draw_deck()
-    draw_players_hands()
-    show_log()
-    
+    if view is None:
+        start()
+    view.update()
+
+
+def draw():
+    global loaded
+    if view is None:
+        return
+    view.draw()
+    if loaded is not None:
+        print('First frame drawn {:.0f} ms after loading'.format(
+            1000 * (perf_counter() - loaded)
+        ))
+        loaded = None
+
+
 def on_mouse_down(pos):
-    if game.player == game.game.current_player:
-        for card in game.player.hand:
-            if card.sprite.collidepoint(pos):
-                game_data.selected_card = game.player.hand.index(card)
-                print('Selected card {} index {}'.format(card, game.player.hand.index(card)))
-        if deck_img.collidepoint(pos):
-            game_data.selected_card = False
-            print('Selected pick up')
-        for color, card in color_imgs.items():
-            if card.collidepoint(pos):
-                game_data.selected_color = color
-                game_data.color_selected_required = False
-# pgzrun.go(draw_deck)
-# pgzrun.go(draw_players_hands)
-# pgzrun.go(show_log)
-# pgzrun.go(update)
-# pgzrun.go(on_mouse_down)
\ No newline at end of file
+    if view is not None:
+        view.on_mouse_down(pos)
+
+
+def main(args=None):
+    global num_players, seed
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--players', type=int, choices=range(2, 16), default=num_players,
+        metavar='{2..15}'
+    )
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(args)
+    num_players = args.players
+    seed = args.seed
+    pgzrun.go()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import pytest
 from uno import *
+from policies import first_playable
 
 
 with pytest.raises(TypeError):
@@ -92,6 +93,38 @@ assert not card1.playable(card2)
 
 
 
+assert len(CARDS) == 54
+assert len(DECK) == 108
+for kind, card in enumerate(CARDS):
+    assert card.kind == kind
+    assert UnoCard(card.color, card.card_type) == card
+assert sum(card.color == 'black' for card in DECK) == 8
+assert sum(card == UnoCard('red', 0) for card in DECK) == 1
+assert sum(card == UnoCard('red', 1) for card in DECK) == 2
+assert sum(card == UnoCard('red', '+2') for card in DECK) == 2
+
+card1 = COLORED_BLACK_CARDS[UnoCard('black', '+4').kind]['green']
+assert card1 == UnoCard('black', '+4')
+assert card1._color == 'green'
+assert card1.playable(UnoCard('green', 5))
+assert not card1.playable(UnoCard('red', 5))
+assert CARDS[card1.kind].temp_color is None
+
+
+
+for top in list(CARDS) + [
+    card for colored in COLORED_BLACK_CARDS.values()
+    for card in colored.values()
+]:
+    for card in CARDS:
+        assert top.playable(card) == (
+            top._color == card.color or
+            top.card_type == card.card_type or
+            card.color == 'black'
+        )
+
+
+
 with pytest.raises(TypeError):
     game = UnoGame()
 
@@ -165,6 +198,27 @@ player = UnoPlayer(uno_cards)
 
 
 
+player = UnoPlayer(uno_cards)
+assert player.kind_counts[UnoCard('red', 0).kind] == 1
+assert player.color_counts[COLOR_IDS['blue']] == 2
+assert player.can_play(UnoCard('green', 2))
+assert player.playable_cards(UnoCard('green', 2)) == [3, 6]
+assert player.playable_cards(UnoCard('blue', 'skip')) == [4, 5, 6]
+card = player.remove_card(6)
+assert card == UnoCard('black', 'wildcard')
+assert player.playable_cards(UnoCard('green', 2)) == [3]
+player.add_cards([UnoCard('yellow', 2), UnoCard('green', 'skip')])
+assert player.playable_cards(UnoCard('green', 2)) == [3, 6, 7]
+player.remove_card(3)
+player.remove_card(5)
+player.remove_card(5)
+assert not player.can_play(UnoCard('green', 2))
+assert player.hand_mask == sum(
+    1 << card.kind for card in CARDS if card in player.hand
+)
+
+
+
 rc = ReversibleCycle(range(3))
 a = next(rc)
 assert a == 0
@@ -204,6 +258,196 @@ assert a == 1
 
 
 
+turns = TurnOrder(range(5))
+assert turns.current == 0
+assert turns.peek() == 1
+assert turns.peek(3) == 3
+assert turns.advance(7) == 2
+assert turns.current == 2
+turns.reverse()
+assert turns.direction == -1
+assert turns.peek() == 1
+assert turns.advance(4) == 3
+assert turns.advance() == 2
+turns = TurnOrder('abc', position=4, direction=-1)
+assert turns.current == 'b'
+assert turns.advance(2) == 'c'
+
+
+
+game = UnoGame(4, random=False)
+for player in game.players:
+    player.add_cards([UnoCard('yellow', 'reverse'), UnoCard('yellow', 'skip')])
+    player.add_cards([UnoCard('yellow', '+2')])
+assert game.direction == 1
+game.play(player=0, card=7)
+assert game.direction == -1
+assert game.current_player == game.players[3]
+assert game.next_player == game.players[2]
+game.play(player=3, card=8)
+assert game.current_player == game.players[1]
+hand_size = len(game.players[0].hand)
+game.play(player=1, card=9)
+assert len(game.players[0].hand) == hand_size + 2
+assert game.current_player == game.players[3]
+game.play(player=3, card=7)
+assert game.direction == 1
+assert game.current_player == game.players[0]
+
+
+
+game = UnoGame(3, random=False)
+player = game.players[0]
+while len(player.hand) > 1:
+    player.remove_card(0)
+player.add_cards([UnoCard('yellow', '+2')])
+player.remove_card(0)
+hand_size = len(game.players[1].hand)
+game.play(player=0, card=0)
+assert not game.is_active
+assert game.winner is player
+assert len(game.players[1].hand) == hand_size + 2
+with pytest.raises(ValueError):
+    game.play(player=game.current_player.player_id, card=0)
+# picking up is refused too, leaving the finished game as it was
+hand_size = len(game.current_player.hand)
+with pytest.raises(ValueError, match='Game is over'):
+    game.play(player=game.current_player.player_id)
+assert len(game.current_player.hand) == hand_size
+
+
+
+def play_first(game):
+    player = game.current_player
+    playable = player.playable_cards(game.current_card)
+    if playable:
+        game.play(player.player_id, playable[0], new_color='blue')
+    else:
+        game.play(player.player_id, card=None)
+
+
+game = UnoGame(4, rng=3, history=True)
+state = game.snapshot()
+hands = [player.hand[:] for player in game.players]
+for i in range(30):
+    play_first(game)
+assert game.snapshot() != state
+game.restore(state)
+assert game.snapshot() == state
+assert [player.hand for player in game.players] == hands
+assert game.current_player == game.players[0]
+
+for i in range(20):
+    play_first(game)
+clone = game.clone()
+assert clone.snapshot() == game.snapshot()
+assert clone.players[0] is not game.players[0]
+before = game.snapshot()
+while clone.is_active:
+    play_first(clone)
+assert game.snapshot() == before
+assert clone.winner in clone.players
+
+states = []
+while game.is_active:
+    states.append(game.snapshot())
+    play_first(game)
+for state in reversed(states):
+    game.undo()
+    assert game.snapshot() == state
+assert game.snapshot() == state
+with pytest.raises(ValueError):
+    game.restore(UnoGame(2).snapshot())
+
+# positions differing only in the colour chosen for a black card differ
+game = UnoGame(3, rng=3, history=True)
+player = game.current_player
+player.add_cards([UnoCard('black', 'wildcard')])
+wildcard = len(player.hand) - 1
+game.play(player.player_id, wildcard, new_color='red')
+red = game.snapshot()
+game.undo()
+game.play(player.player_id, wildcard, new_color='blue')
+blue = game.snapshot()
+assert red != blue
+game.restore(red)
+assert game.current_card.temp_color == 'red'
+assert game.snapshot() == red
+
+game = UnoGame(2)
+game.play(player=0, card=None)
+with pytest.raises(ValueError):
+    game.undo()
+
+
+
+game = UnoGame(3, random=False)
+player = game.players[0]
+player.add_cards([UnoCard('black', '+4')])
+moves = list(game.legal_moves())
+assert moves == [
+    Move(i, player.hand[i].color == 'black')
+    for i in player.playable_cards(game.current_card)
+]
+assert moves[-1] == Move(7, True)
+observation = game.observe()
+assert observation.player_id == 0
+assert observation.hand == tuple(player.hand)
+assert observation.hand_sizes == (8, 7, 7)
+assert observation.current_card is game.current_card
+assert observation.current_color == 'red'
+assert observation.direction == 1
+assert observation.draw_pile_size == len(game.draw_pile)
+assert observation.discard_pile == tuple(game.discard_pile)
+assert observation.color_counts == tuple(
+    sum(card.color == color for card in player.hand) for color in COLORS
+)
+
+seen = []
+
+
+def policy(observation, moves, rng):
+    seen.append((observation.player_id, moves))
+    return moves[-1].card, 'green'
+
+
+card, new_color = game.play_turn(policy)
+assert card == UnoCard('black', '+4')
+assert new_color == 'green'
+assert seen == [(0, moves)]
+assert game.current_card._color == 'green'
+assert len(game.players[1].hand) == 11
+assert game.current_player == game.players[2]
+
+game = UnoGame(2, random=False)
+player = game.players[0]
+while player.can_play(game.current_card):
+    player.remove_card(player.playable_cards(game.current_card)[0])
+assert list(game.legal_moves()) == [PICK_UP]
+assert game.legal_actions() == [PICK_UP_ACTION]
+hand_size = len(player.hand)
+assert game.play_turn(policy) == (None, None)
+assert len(player.hand) == hand_size + 1
+
+# legal actions are the playable kinds, with a colour for black ones
+game = UnoGame(4, rng=1)
+player = game.current_player
+actions = game.legal_actions()
+playable = player.playable_cards(game.current_card)
+assert {kind for kind, color in actions} == {
+    player.hand[i].kind for i in playable
+}
+for kind, color in actions:
+    assert (color is None) == (CARDS[kind].color != 'black')
+kind, color = actions[-1]
+hand_size = len(player.hand)
+game.play_action(actions[-1])
+assert game.discard_pile[-1].kind == kind
+assert game.current_card._color == (color or CARDS[kind].color)
+assert len(player.hand) == hand_size - 1
+
+
+
 for n in range(2, 16):
     game = UnoGame(n)
     assert len(game.players) == n
@@ -215,6 +459,101 @@ for n in range(2, 16):
 
 
 
+game = UnoGame(3)
+assert len(game.discard_pile) == 1
+assert len(game.draw_pile) == 108 - 7*3 - 1
+assert game.deck[-1] is game.current_card
+assert game.deck[0] is game.draw_pile[-1]
+for i in range(100):
+    player = game.current_player
+    if player.can_play(game.current_card):
+        card = player.playable_cards(game.current_card)[0]
+        game.play(player.player_id, card, new_color='red')
+    else:
+        game.play(player.player_id, card=None)
+    if not game.is_active:
+        break
+    assert len(game.deck) + sum(len(p.hand) for p in game.players) == 108
+
+game = UnoGame(2, random=False)
+top = game.current_card
+game.discard_pile[:0] = game.draw_pile[:0:-1]
+del game.draw_pile[1:]
+oldest_discard = game.discard_pile[0]
+game.play(player=0, card=None)
+game.play(player=1, card=None)
+assert len(game.discard_pile) == 1
+assert game.current_card is top
+assert len(game.draw_pile) == 108 - 7*2 - 3
+assert game.players[1].hand[-1] is oldest_discard
+
+wildcard = UnoCard('black', 'wildcard')
+game.discard_pile.insert(0, COLORED_BLACK_CARDS[wildcard.kind]['red'])
+game.draw_pile.clear()
+game.play(player=0, card=None)
+assert game.players[0].hand[-1] is CARDS[wildcard.kind]
+
+game = UnoGame(2)
+for player in game.players:
+    game._pick_up(player, 100)
+assert not game.draw_pile
+assert len(game.discard_pile) == 1
+assert sum(len(p.hand) for p in game.players) == 107
+
+
+
+game1 = UnoGame(4, rng=5)
+game2 = UnoGame(4, rng=Random(5))
+assert game1.deck == game2.deck
+assert [p.hand for p in game1.players] == [p.hand for p in game2.players]
+
+
+def transcript(game):
+    moves = []
+    while game.is_active and len(moves) < 1000:
+        moves.append(game.play_turn(first_playable))
+    return moves, game.winner.player_id
+
+
+rng = Random(5)
+assert make_rng(rng) is rng
+assert make_rng(None) is make_rng()
+assert make_rng(5).random() == Random(5).random()
+assert transcript(UnoGame(4, rng=5)) == transcript(UnoGame(4, rng=5))
+assert transcript(UnoGame(4, rng='x')) == transcript(UnoGame(4, rng='x'))
+assert transcript(UnoGame(4, rng=5)) != transcript(UnoGame(4, rng=6))
+assert UnoGame(4, rng=rng).rng is rng
+
+# seeds give the same game in every process
+import subprocess
+import sys
+script = (
+    'from uno import UnoGame; from policies import first_playable; '
+    'game = UnoGame(4, rng=7); '
+    'print([str(game.play_turn(first_playable)) for i in range(50)])'
+)
+outputs = {
+    subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True,
+        check=True
+    ).stdout
+    for i in range(2)
+}
+game = UnoGame(4, rng=7)
+assert outputs == {
+    str([str(game.play_turn(first_playable)) for i in range(50)]) + '\n'
+}
+
+# a generator that cannot be copied is shared with clones
+from random import SystemRandom
+rng = SystemRandom()
+game = UnoGame(2, rng=rng)
+clone = game.clone()
+assert clone.rng is rng
+assert clone.snapshot() == game.snapshot()
+
+
+
 game = UnoGame(2)
 assert isinstance(game.current_card, UnoCard)
 assert game.is_active
@@ -325,4 +664,28 @@ with pytest.raises(ValueError):
     game.play(player=2, card=0)
 
 with pytest.raises(ValueError):
-    game.play(player=1, card=0)
\ No newline at end of file
+    game.play(player=1, card=0)
+
+
+
+assert '{:full}'.format(UnoCard('red', 7)) == 'red 7'
+assert '{}'.format(UnoCard('blue', 'skip')) == 'BS'
+assert '{:full}'.format(COLORED_BLACK_CARDS[53]['green']) == 'green +4'
+
+# a black first card is only given a colour when asked for
+for seed in range(200):
+    plain = UnoGame(3, rng=seed)
+    colored = UnoGame(3, rng=seed, color_first_card=True)
+    assert [p.hand for p in plain.players] == [p.hand for p in colored.players]
+    top = colored.current_card
+    if plain.current_card.color_id == BLACK:
+        assert plain.current_card.temp_color is None
+        assert top.kind == plain.current_card.kind
+        assert top.temp_color in COLORS
+        assert colored.players[0].can_play(top) == any(
+            card.color in (top.temp_color, 'black') or
+            card.card_type == top.card_type
+            for card in colored.players[0].hand
+        )
+    else:
+        assert top is plain.current_card
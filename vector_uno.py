@@ -0,0 +1,316 @@
+"""Lockstep simulation of a batch of Uno games in NumPy arrays.
+
+VectorUnoGame plays the same rules as UnoGame for many games at once: hands
+are per-kind count matrices and every step() plays one turn of every active
+game with a handful of array operations. Each game is shuffled with the
+same random.Random as the simulate() game with the same (seed, number), so
+with a deterministic policy both engines play exactly the same games.
+
+Requires NumPy. Run ``python vector_uno.py --games 10000`` for a benchmark.
+"""
+import argparse
+from time import perf_counter
+import numpy as np
+from uno import KINDS, COLOR_IDS, TYPE_IDS, BLACK, PLAYABLE, DECK
+from simulate import SimulationStats, MAX_TURNS, game_rng
+from simulate import print_stats, print_benchmark
+
+
+KIND_COLOR = np.array([COLOR_IDS[color] for color, _ in KINDS], np.intp)
+KIND_TYPE = np.array(
+    [TYPE_IDS[card_type] for _, card_type in KINDS], np.intp
+)
+N_TYPES = len(TYPE_IDS)
+# LEGAL[state, kind] is True when a card of kind can be played on a card
+# whose state is its (effective colour, type) as numbered by UnoCard.state
+LEGAL = np.array(
+    [[mask >> kind & 1 for kind in range(len(KINDS))] for mask in PLAYABLE],
+    bool
+)
+DECK_KINDS = [card.kind for card in DECK]
+
+_SKIP, _REVERSE, _DRAW_TWO, _DRAW_FOUR = (
+    TYPE_IDS[card_type] for card_type in ('skip', 'reverse', '+2', '+4')
+)
+# players skipped over and cards picked up by the next player, per type
+SKIPS = np.zeros(N_TYPES, np.intp)
+SKIPS[[_SKIP, _DRAW_TWO, _DRAW_FOUR]] = 1
+PENALTIES = np.zeros(N_TYPES, np.intp)
+PENALTIES[_DRAW_TWO] = 2
+PENALTIES[_DRAW_FOUR] = 4
+
+
+def lowest_kind(game, index, legal):
+    """Play the playable card with the lowest kind, choosing the colour the
+    player holds most of for black cards, or pick up. The vector version of
+    policies.lowest_playable."""
+    kinds = np.where(legal.any(1), legal.argmax(1), -1)
+    hands = game.hands[index, game.current[index], :52]
+    colors = hands.reshape(-1, 4, 13).sum(2).argmax(1)
+    return kinds, colors
+
+
+def random_kind(game, index, legal):
+    """Play a random playable card, each card in hand being equally likely,
+    with a random colour for black cards, or pick up."""
+    weights = np.where(legal, game.hands[index, game.current[index]], 0)
+    cumulative = weights.cumsum(1)
+    totals = cumulative[:, -1]
+    targets = game.np_rng.random(len(index)) * totals
+    kinds = (cumulative <= targets[:, None]).sum(1)
+    kinds = np.where(totals > 0, kinds, -1)
+    colors = game.np_rng.integers(0, 4, len(index))
+    return kinds, colors
+
+
+POLICIES = {
+    'lowest': lowest_kind,
+    'random': random_kind,
+}
+
+
+class VectorUnoGame:
+    """games games of players players. With fast_shuffle the decks are
+    shuffled in bulk by the NumPy generator instead of one random.Random per
+    game, which is much quicker when many games are dealt at once but no
+    longer plays the same games as simulate()."""
+    def __init__(self, games, players, seed=None, fast_shuffle=False) -> None:
+        if not isinstance(players, int):
+            raise ValueError('Invalid game: players must be integer')
+        if not 2 <= players <= 15:
+            raise ValueError('Invalid game: must be between 2 and 15 players')
+        if not isinstance(games, int) or games < 1:
+            raise ValueError('Invalid games: must be a positive integer')
+
+        self.games = games
+        self.players = players
+        self.seed = seed
+        self.fast_shuffle = fast_shuffle
+        self.rngs = [None] * games
+        self.np_rng = np.random.default_rng(seed)
+        self.dealt = 0
+
+        cards = len(DECK_KINDS)
+        self.hands = np.zeros((games, players, len(KINDS)), np.int16)
+        self.hand_sizes = np.zeros((games, players), np.intp)
+        self.discard_pile = np.zeros((games, cards), np.intp)
+        self.discard_size = np.zeros(games, np.intp)
+        self.draw_pile = np.zeros((games, cards), np.intp)
+        self.draw_size = np.zeros(games, np.intp)
+        self.color = np.zeros(games, np.intp)
+        self.card_type = np.zeros(games, np.intp)
+        self.current = np.zeros(games, np.intp)
+        self.direction = np.zeros(games, np.intp)
+        self.winner = np.zeros(games, np.intp)
+        self.turns = np.zeros(games, np.intp)
+        self.cards_drawn = np.zeros(games, np.intp)
+        self.reset(np.arange(games))
+
+    def reset(self, index):
+        """Deal new games in the rows given by index. Games are numbered in
+        the order they are dealt and, unless fast_shuffle is set, shuffled
+        with the same random number generator as the simulate() game with
+        that number."""
+        index = np.asarray(index, np.intp)
+        if self.fast_shuffle:
+            keys = self.np_rng.random((len(index), len(DECK_KINDS)))
+            decks = np.take(DECK_KINDS, keys.argsort(1))
+            self.dealt += len(index)
+        else:
+            decks = np.empty((len(index), len(DECK_KINDS)), np.intp)
+            for deck, row in zip(decks, index):
+                self.rngs[row] = rng = game_rng(self.seed, self.dealt)
+                self.dealt += 1
+                kinds = list(DECK_KINDS)
+                rng.shuffle(kinds)
+                deck[:] = kinds
+
+        # hands are dealt from the end of the deck, 7 cards per player
+        dealt = 7 * self.players
+        rows = np.repeat(index, dealt)
+        seats = np.tile(np.repeat(np.arange(self.players), 7), len(index))
+        self.hands[index] = 0
+        kinds = decks[:, :-dealt - 1:-1].ravel()
+        np.add.at(self.hands, (rows, seats, kinds), 1)
+        self.hand_sizes[index] = 7
+
+        top = decks[:, -dealt - 1]
+        self.discard_pile[index, 0] = top
+        self.discard_size[index] = 1
+        # the draw pile is a stack with its top card last, as in UnoGame
+        remaining = len(DECK_KINDS) - dealt - 1
+        self.draw_pile[index, :remaining] = decks[:, remaining - 1::-1]
+        self.draw_size[index] = remaining
+
+        self.color[index] = KIND_COLOR[top]
+        self.card_type[index] = KIND_TYPE[top]
+        self.current[index] = 0
+        self.direction[index] = 1
+        self.winner[index] = -1
+        self.turns[index] = 0
+        self.cards_drawn[index] = 0
+
+    def __repr__(self) -> str:
+        return '<VectorUnoGame object: {} games of {} players>'.format(
+            self.games, self.players
+        )
+
+    @property
+    def active(self):
+        return self.winner < 0
+
+    @property
+    def state(self):
+        return self.color * N_TYPES + self.card_type
+
+    @property
+    def current_card(self):
+        games = np.arange(self.games)
+        return self.discard_pile[games, self.discard_size - 1]
+
+    def legal(self, index):
+        """Return the playable kinds in the current player's hand for each of
+        the games in index as a boolean (games, kinds) array."""
+        hands = self.hands[index, self.current[index]]
+        return LEGAL[self.state[index]] & (hands > 0)
+
+    def step(self, policy=lowest_kind, index=None):
+        """Play one turn of every active game, or of the games in index,
+        which must all be active, and return how many were played. policy is
+        called with the game, the indices of those games and their legal()
+        moves, and returns the kind played in each (-1 to pick up) and the
+        colour chosen for black cards."""
+        if index is None:
+            index = np.flatnonzero(self.winner < 0)
+        if not index.size:
+            return 0
+        current = self.current[index]
+        kinds, colors = policy(self, index, self.legal(index))
+        self.turns[index] += 1
+
+        pick_up = kinds < 0
+        games = index[pick_up]
+        players = current[pick_up]
+        self._pick_up(games, players, 1)
+        players += self.direction[games]
+        self.current[games] = players % self.players
+
+        play = ~pick_up
+        games = index[play]
+        players = current[play]
+        kinds = kinds[play]
+        self.hands[games, players, kinds] -= 1
+        self.hand_sizes[games, players] -= 1
+        self.discard_pile[games, self.discard_size[games]] = kinds
+        self.discard_size[games] += 1
+        card_types = KIND_TYPE[kinds]
+        card_colors = KIND_COLOR[kinds]
+        self.color[games] = np.where(
+            card_colors == BLACK, colors[play], card_colors
+        )
+        self.card_type[games] = card_types
+        self.direction[games[card_types == _REVERSE]] *= -1
+
+        direction = self.direction[games]
+        penalties = PENALTIES[card_types]
+        victims = penalties > 0
+        self._pick_up(
+            games[victims],
+            (players[victims] + direction[victims]) % self.players,
+            penalties[victims]
+        )
+        won = self.hand_sizes[games, players] == 0
+        self.winner[games[won]] = players[won]
+        steps = SKIPS[card_types] + ~won
+        self.current[games] = (players + direction * steps) % self.players
+        return index.size
+
+    def run(self, policy=lowest_kind, max_turns=MAX_TURNS):
+        """Step every game until it is won or has taken max_turns turns."""
+        for turn in range(max_turns):
+            if not self.step(policy):
+                break
+
+    def _pick_up(self, games, players, n):
+        n = np.broadcast_to(n, games.shape)
+        for i in range(n.max(initial=0)):
+            drawing = n > i
+            g = games[drawing]
+            p = players[drawing]
+            empty = self.draw_size[g] == 0
+            if empty.any():
+                for game in g[empty]:
+                    self._reshuffle(game)
+                has_cards = self.draw_size[g] > 0
+                g = g[has_cards]
+                p = p[has_cards]
+            self.draw_size[g] -= 1
+            kinds = self.draw_pile[g, self.draw_size[g]]
+            self.hands[g, p, kinds] += 1
+            self.hand_sizes[g, p] += 1
+            self.cards_drawn[g] += 1
+
+    def _reshuffle(self, game):
+        size = self.discard_size[game] - 1
+        if self.fast_shuffle:
+            kinds = self.np_rng.permutation(self.discard_pile[game, :size])
+        else:
+            kinds = self.discard_pile[game, :size].tolist()
+            self.rngs[game].shuffle(kinds)
+        self.draw_pile[game, :size] = kinds
+        self.draw_size[game] = size
+        self.discard_pile[game, 0] = self.discard_pile[game, size]
+        self.discard_size[game] = 1
+
+    def stats(self):
+        """Return the results so far as SimulationStats."""
+        stats = SimulationStats(self.players)
+        stats.games = self.games
+        stats.unfinished = int(self.active.sum())
+        stats.turns = int(self.turns.sum())
+        stats.min_turns = int(self.turns.min())
+        stats.max_turns = int(self.turns.max())
+        stats.cards_drawn = int(self.cards_drawn.sum())
+        won = self.winner[self.winner >= 0]
+        stats.wins = np.bincount(won, minlength=self.players).tolist()
+        return stats
+
+
+def simulate(players, games, policy=lowest_kind, seed=None,
+             max_turns=MAX_TURNS):
+    """Play games games of players players in one batch and return their
+    SimulationStats, like simulate.simulate."""
+    started = perf_counter()
+    game = VectorUnoGame(games, players, seed)
+    game.run(policy, max_turns)
+    stats = game.stats()
+    stats.seconds = perf_counter() - started
+    return stats
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--policy', choices=sorted(POLICIES), default='lowest'
+    )
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument(
+        '--benchmark', action='store_true',
+        help='report games/sec and turns/sec instead of game statistics'
+    )
+    args = parser.parse_args(args)
+    stats = simulate(
+        args.players, args.games, POLICIES[args.policy], args.seed,
+        args.max_turns
+    )
+    if args.benchmark:
+        print_benchmark(stats)
+    else:
+        print_stats(stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import pytest
+np = pytest.importorskip('numpy')
+from uno import UnoGame, KINDS
+from policies import lowest_playable
+from simulate import game_rng
+from simulate import simulate as simulate_games
+from vector_uno import *
+
+
+def hand_counts(player):
+    counts = [0] * len(KINDS)
+    for card in player.hand:
+        counts[card.kind] += 1
+    return counts
+
+
+for players in (2, 5, 15):
+    vector = VectorUnoGame(40, players, seed=players)
+    games = [
+        UnoGame(players, rng=game_rng(players, i)) for i in range(40)
+    ]
+    for turn in range(300):
+        for i, game in enumerate(games):
+            assert vector.winner[i] == (
+                -1 if game.winner is None else game.winner.player_id
+            )
+            if not game.is_active:
+                continue
+            for player in game.players:
+                assert vector.hands[i, player.player_id].tolist() == (
+                    hand_counts(player)
+                )
+            assert vector.current_card[i] == game.current_card.kind
+            assert vector.state[i] == game.current_card.state
+            assert vector.current[i] == game.current_player.player_id
+            assert vector.direction[i] == game.direction
+            assert vector.draw_size[i] == len(game.draw_pile)
+            game.play_turn(lowest_playable)
+        if not vector.step():
+            break
+    assert not vector.active.any()
+    assert all(not game.is_active for game in games)
+
+
+
+stats = simulate(4, 300, seed=9)
+expected = simulate_games(4, 300, lowest_playable, seed=9)
+assert stats.wins == expected.wins
+assert stats.turns == expected.turns
+assert stats.cards_drawn == expected.cards_drawn
+assert stats.min_turns == expected.min_turns
+assert stats.max_turns == expected.max_turns
+
+stats = simulate(6, 300, random_kind, seed=1)
+assert stats.games == 300
+assert stats.unfinished == 0
+assert sum(stats.wins) == 300
+
+game = VectorUnoGame(10, 3, seed=1)
+game.run(max_turns=2)
+assert (game.turns == 2).all()
+assert game.stats().unfinished == 10
+assert (game.hand_sizes == game.hands.sum(2)).all()
+assert (
+    game.hands.sum((1, 2)) + game.draw_size + game.discard_size == 108
+).all()
+
+with pytest.raises(ValueError):
+    VectorUnoGame(10, 1)
+
+with pytest.raises(ValueError):
+    VectorUnoGame(0, 4)
+
+
+# a NumPy Generator seeds a game reproducibly
+from uno import make_rng
+first = UnoGame(4, rng=np.random.default_rng(3))
+second = UnoGame(4, rng=np.random.default_rng(3))
+assert first.draw_pile == second.draw_pile
+assert make_rng(np.random.default_rng(3)).random() == (
+    make_rng(np.random.default_rng(3)).random()
+)